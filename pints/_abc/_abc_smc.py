@@ -7,6 +7,13 @@
 #
 import pints
 import numpy as np
+import scipy.linalg
+
+try:
+    from scipy.special import logsumexp
+except ImportError:     # pragma: no cover
+    # Older versions
+    from scipy.misc import logsumexp
 
 
 class ABCSMC(pints.ABCSampler):
@@ -89,10 +96,13 @@ class ABCSMC(pints.ABCSampler):
         self._samples = [[], []]
         self._accepted_count = 0
         self._weights = []
+        self._log_weights = None
+        self._cumulative_weights = None
+        self._sample_log_priors = []
         self._xs = None
+        self._xs_log_prior = None
         self._ready_for_tell = False
         self._t = 0
-        self._to_print = True
 
         # Setting the perturbation kernel
         if perturbation_kernel is None:
@@ -115,30 +125,31 @@ class ABCSMC(pints.ABCSampler):
         if self._ready_for_tell:
             raise RuntimeError('ask called before tell.')
         if self._t == 0:
-            if self._to_print:
-                self._to_print = False
-                print(
-                    "Starting t=" + str(self._t)
-                    + ", with threshold=" + str(self._threshold))
             self._xs = self._log_prior.sample(n_samples)
+            self._xs_log_prior = None
         else:
-            self._xs = [None] * n_samples
-            i = 0
-            while i < n_samples:
-                theta_s_s = None
-                while (theta_s_s is None or
-                       self._log_prior(theta_s_s) == -np.inf):
-                    indices = np.random.choice(
-                        range(len(self._samples[(self._t - 1) % 2])),
-                        p=self._weights[self._t - 1])
-                    theta_s = self._samples[(self._t - 1) % 2][indices]
-                    # perturb using K_t
-                    theta_s_s = np.add(theta_s,
-                                       self._perturbation_kernel.sample(1)[0])
-                    # check if theta_s_s is possible under the prior
-                    # sample again if not
-                self._xs[i] = theta_s_s
-                i = i + 1
+            old_samples = self._samples[(self._t - 1) % 2]
+            xs = []
+            log_priors = []
+            while len(xs) < n_samples:
+                # Propose all remaining points at once: sample particles from
+                # the previous generation, and perturb them using K_t
+                n = n_samples - len(xs)
+                indices = np.searchsorted(
+                    self._cumulative_weights, np.random.uniform(size=n),
+                    side='right')
+                proposed = old_samples[indices] \
+                    + self._perturbation_kernel.sample(n)
+
+                # Keep the points that are possible under the prior, and
+                # store their log prior for reuse in the weight calculation
+                for x in proposed:
+                    log_prior = self._log_prior(x)
+                    if log_prior != -np.inf:
+                        xs.append(x)
+                        log_priors.append(log_prior)
+            self._xs = np.array(xs)
+            self._xs_log_prior = np.array(log_priors)
         self._ready_for_tell = True
         intermediate = np.array(self._xs, copy=True)
 
@@ -152,55 +163,93 @@ class ABCSMC(pints.ABCSampler):
         if not self._ready_for_tell:
             raise RuntimeError('tell called before ask.')
         self._ready_for_tell = False
-        fx = np.asarray(fx)
+        fx = pints.vector(fx)
         accepted = fx < self._threshold
         if np.any(accepted) > 0:
+            accepted_xs = self._xs[accepted]
             if self._t < len(self._e_schedule) - 1:
-                self._accepted_count += sum(accepted)
-                self._samples[self._t % 2].extend(
-                    [self._xs[c].tolist() for c, x in enumerate(accepted) if x]
-                )
+                self._accepted_count += len(accepted_xs)
+                # Store a copy, so that the returned points can be modified
+                # without affecting the current generation
+                self._samples[self._t % 2].extend(accepted_xs.copy())
+                if self._t > 0:
+                    self._sample_log_priors.extend(
+                        self._xs_log_prior[accepted])
 
                 if self._accepted_count >= self._nr_samples:
                     self._advance_time()
-            return [self._xs[c].tolist() for c, x in
-                    enumerate(accepted) if x]
+            return accepted_xs
 
         return None
 
     def _advance_time(self):
         t = self._t
+
+        # Store the completed generation as a single array, so that it can be
+        # indexed in ask and used in the weight calculation without copying
+        self._samples[t % 2] = np.array(self._samples[t % 2])
+
+        n = len(self._samples[t % 2])
         if t == 0:
-            self._weights.append(
-                np.full(self._accepted_count, 1 / self._accepted_count))
+            log_weights = np.full(n, -np.log(n))
         else:
-            unnorm_weights = self._calculate_weights(
-                self._samples[self._t % 2], self._samples[(self._t - 1) % 2],
-                self._weights[t - 1])
+            log_weights = self._calculate_log_weights(
+                self._samples[t % 2], self._sample_log_priors,
+                self._samples[(t - 1) % 2], self._log_weights)
             # Normalise weights
-            normal = sum(unnorm_weights)
-            self._weights.append([w / normal for w in unnorm_weights])
+            log_weights -= logsumexp(log_weights)
+        self._weights.append(np.exp(log_weights))
+
+        # Cache the log weights for the next generation's weight calculation,
+        # and the cumulative weights used to sample from p_t in ask
+        self._log_weights = log_weights
+        self._cumulative_weights = np.cumsum(self._weights[t])
+        self._cumulative_weights /= self._cumulative_weights[-1]
 
         self._samples[(t + 1) % 2] = []
+        self._sample_log_priors = []
         self._accepted_count = 0
         self._t += 1
         self._threshold = self._e_schedule[self._t]
-        print(
-            "Starting t=" + str(self._t)
-            + ", with threshold=" + str(self._threshold))
-
-    def _calculate_weights(self, new_samples, old_samples, old_weights):
-        new_weights = []
-        for i in range(0, self._accepted_count):
-            prior_prob = np.exp(self._log_prior(new_samples[i]))
-
-            mw = [old_weights[j] * np.exp(self._perturbation_kernel(
-                np.subtract(new_samples[i], old_samples[j])))
-                for j in range(len(old_samples))]
-
-            w = prior_prob / sum(mw)
-            new_weights.append(w)
-        return new_weights
+
+    def _calculate_log_weights(
+            self, new_samples, new_log_priors, old_samples, log_old_weights):
+        # Calculate weights in log space, to avoid underflow when the kernel
+        # densities are small
+        kernel = self._perturbation_kernel
+        if type(kernel) is pints.MultivariateGaussianLogPrior:
+            # For the default Gaussian kernel, evaluate the log density of all
+            # new-old differences at once, using its cached Cholesky factor:
+            # log N(d | mu, S) = c - |L^-1 (d - mu)|^2 / 2, with S = L L^T
+            # Subclasses may change the behaviour, so check for the exact type
+            d = new_samples[:, None, :] - old_samples[None, :, :]
+            d = (d - kernel._mean).reshape(-1, d.shape[2])
+            z = scipy.linalg.solve_triangular(
+                kernel._sample_L, d.T, lower=True)
+            log_kernel = kernel._const_factor - 0.5 * np.sum(z**2, axis=0)
+            log_kernel = log_kernel.reshape(len(new_samples), len(old_samples))
+            return np.asarray(new_log_priors) - logsumexp(
+                log_old_weights + log_kernel, axis=1)
+
+        # Otherwise, call the (arbitrary LogPrior) kernel for every pair
+        log_weights = np.empty(len(new_samples))
+        for i, x in enumerate(new_samples):
+            # Log kernel density of x, perturbed from each of the old samples
+            log_kernel = np.array([
+                self._perturbation_kernel(d) for d in x - old_samples])
+
+            log_weights[i] = new_log_priors[i] - logsumexp(
+                log_old_weights + log_kernel)
+        return log_weights
+
+    def _log_init(self, logger):
+        """ See :meth:`Loggable._log_init()`. """
+        logger.add_int('t')
+        logger.add_float('Threshold')
+
+    def _log_write(self, logger):
+        """ See :meth:`Loggable._log_write()`. """
+        logger.log(self._t, self._threshold)
 
     def set_perturbation_kernel(self, perturbation_kernel):
         """
@@ -12,10 +12,18 @@ def autocorrelation(x):
     """
     Calculates autocorrelation for a vector ``x`` using a spectrum density
     calculation.
+
+    If ``x`` is a 2d array of shape ``(n_samples, n_parameters)`` the
+    autocorrelation of each column is calculated in a single pass.
     """
-    x = (x - np.mean(x)) / (np.std(x) * np.sqrt(len(x)))
-    result = np.correlate(x, x, mode='full')
-    return result[int(result.size / 2):]
+    x = np.asarray(x, dtype=float)
+    n = len(x)
+    x = (x - np.mean(x, axis=0)) / (np.std(x, axis=0) * np.sqrt(n))
+
+    # Zero-pad to avoid circular wrap-around, then use the power spectrum
+    # (Wiener-Khinchin) to get the correlation in O(n log n)
+    f = np.fft.rfft(x, n=2 * n, axis=0)
+    return np.fft.irfft(f.real**2 + f.imag**2, n=2 * n, axis=0)[:n]
 
 
 def _autocorrelate_negative(autocorrelation):
@@ -23,10 +31,11 @@ def _autocorrelate_negative(autocorrelation):
     Returns the index of the first negative entry in ``autocorrelation``, or
     ``len(autocorrelation)`` if no negative entry is found.
     """
-    try:
-        return np.where(np.asarray(autocorrelation) < 0)[0][0]
-    except IndexError:
-        return len(autocorrelation)
+    # argmax returns 0 if no entry is negative, so a single check of the
+    # found entry replaces a separate pass with any()
+    negative = np.asarray(autocorrelation) < 0
+    i = int(np.argmax(negative))
+    return i if negative[i] else len(autocorrelation)
 
 
 def effective_sample_size_single_parameter(x):
@@ -61,8 +70,18 @@ def effective_sample_size(samples):
     if n_samples < 2:
         raise ValueError('At least two samples must be given.')
 
-    return [effective_sample_size_single_parameter(samples[:, i])
-            for i in range(0, n_params)]
+    # Autocorrelation of all parameters at once
+    rho = autocorrelation(samples)
+
+    # Index of first negative autocorrelation, per parameter
+    negative = rho < 0
+    T = np.where(
+        np.any(negative, axis=0), np.argmax(negative, axis=0), n_samples)
+
+    # Sum of the autocorrelations up to (but excluding) T
+    sums = np.cumsum(np.vstack((np.zeros(n_params), rho)), axis=0)
+    ess = n_samples / (1 + 2 * sums[T, np.arange(n_params)])
+    return list(ess)
 
 
 def _within(chains):
@@ -854,9 +854,10 @@ class MultivariateGaussianLogPrior(pints.LogPrior):
         self._mean = mean
         self._cov = cov
         self._n_parameters = mean.shape[0]
-        self._cov_inverse = np.linalg.inv(self._cov)
         self._cholesky_L, self._cholesky_lower = scipy.linalg.cho_factor(
-            self._cov)
+            self._cov, lower=True)
+        # Lower-triangular factor, used to transform standard normal samples
+        self._sample_L = np.tril(self._cholesky_L)
         log_det_cov = 2 * np.sum(np.log(self._cholesky_L.diagonal()))
         self._const_factor = - 0.5 * log_det_cov \
                              - 0.5 * len(self._mean) * np.log(2 * np.pi)
@@ -1040,9 +1041,10 @@ class MultivariateGaussianLogPrior(pints.LogPrior):
 
     def sample(self, n=1):
         """ See :meth:`LogPrior.call()`. """
-        # Note: size=n returns shape (n, d)
-        return np.random.multivariate_normal(
-            self._mean, self._cov, size=n)
+        # Transform standard normal samples using the cached Cholesky factor,
+        # instead of factorising the covariance matrix on every call
+        z = np.random.normal(size=(n, self._n_parameters))
+        return self._mean + z.dot(self._sample_L.T)
 
 
 class NormalLogPrior(GaussianLogPrior):
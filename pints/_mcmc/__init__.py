@@ -799,9 +799,7 @@ class MCMCController(object):
                     # Inverse transform to model space if transformation is
                     # provided
                     if self._transformation:
-                        ys_store = np.zeros(ys.shape)
-                        for i, y in enumerate(ys):
-                            ys_store[i] = self._transformation.to_model(y)
+                        ys_store = self._transformation._to_model_batch(ys)
                     else:
                         ys_store = ys
 
@@ -10,6 +10,82 @@ import numpy as np
 from scipy.special import logit, expit
 
 
+def _vector(x):
+    """
+    Returns ``x`` as a 1d float array, like :meth:`pints.vector()`, but
+    without copying if it already is one.
+
+    Raises a ``ValueError`` if ``x`` has an incompatible shape.
+    """
+    y = np.asarray(x, dtype=float)
+    return y if y.ndim == 1 else pints.vector(x)
+
+
+def _is_elementwise(transformation):
+    """
+    Returns ``transformation.elementwise()``, or ``False`` if the
+    transformation does not implement this (optional) check, so that the
+    general, full-Jacobian code path is used.
+    """
+    try:
+        return transformation.elementwise()
+    except NotImplementedError:
+        return False
+
+
+def _pinv_diag(d):
+    """
+    Returns the (pseudo-)inverse of a diagonal matrix with diagonal ``d``, as
+    a vector. Like ``np.linalg.pinv``, this returns zeros where ``d`` is zero.
+    """
+    d = np.asarray(d, dtype=float)
+    return np.divide(1., d, out=np.zeros_like(d), where=d != 0)
+
+
+def _overridden(transformation, cls, *methods):
+    """
+    Returns ``True`` if any of the given ``methods`` of ``transformation``, an
+    instance of the built-in class ``cls``, are reimplemented by a subclass.
+
+    Built-in transformations use this to check if they can use faster methods
+    derived from their own public methods, e.g. ``jacobian_diag()`` from
+    ``jacobian()``, or if a subclass has changed the public methods.
+    """
+    t = type(transformation)
+    return any(getattr(t, m) is not getattr(cls, m) for m in methods)
+
+
+def _expit_derivative(q):
+    """
+    Returns ``expit(q) * (1 - expit(q))``, calculated as ``e / (1 + e)^2``
+    with ``e = exp(-|q|)``, which needs a single exp and does not lose
+    precision for large ``|q|``.
+    """
+    e = np.exp(-np.abs(q))
+    return e / (1. + e) ** 2
+
+
+def _expit_and_softplus(q):
+    """
+    Returns ``expit(q)`` and ``softplus(-q) = log(1 + exp(-q))``, using a
+    single evaluation of ``exp(-|q|)`` for both.
+    """
+    e = np.exp(-np.abs(q))
+    return np.where(q >= 0, 1., e) / (1. + e), np.maximum(-q, 0.) + np.log1p(e)
+
+
+def _expit_softplus_and_derivative(q):
+    """
+    Returns ``expit(q)``, ``softplus(-q)``, and the derivative
+    ``expit(q) * (1 - expit(q))``, using a single evaluation of ``exp(-|q|)``
+    for all three.
+    """
+    e = np.exp(-np.abs(q))
+    f = 1. + e
+    return (np.where(q >= 0, 1., e) / f, np.maximum(-q, 0.) + np.log1p(e),
+            e / f ** 2)
+
+
 class Transformation(object):
     """
     Abstract base class for objects that provide transformations between two
@@ -20,6 +96,10 @@ class Transformation(object):
     search space ``q`` by using ``q = trans.to_search(p)`` and the inverse by
     using ``p = trans.to_model(q)``.
 
+    Arrays returned by a transformation may be read-only, and shared between
+    calls (e.g. a constant Jacobian matrix), so they should be copied before
+    they are modified in place.
+
     References
     ----------
     .. [1] How to Obtain Those Nasty Standard Errors From Transformed Data.
@@ -83,8 +163,14 @@ class Transformation(object):
         from the inverse function theorem, i.e. the matrix inverse of the
         Jacobian matrix of an invertible function is the Jacobian matrix of the
         inverse function.
+
+        For element-wise transformations the Jacobian is diagonal, so that its
+        inverse is calculated directly from :meth:`jacobian_diag`.
         """
-        jac_inv = np.linalg.pinv(self.jacobian(q))
+        if _is_elementwise(self):
+            jac_inv = _pinv_diag(self.jacobian_diag(q))
+            return np.asarray(C) * np.outer(jac_inv, jac_inv)
+        jac_inv = self._jacobian_inverse(q)
         return np.matmul(np.matmul(jac_inv, C), jac_inv.T)
 
     def convert_standard_deviation(self, s, q):
@@ -126,9 +212,15 @@ class Transformation(object):
                     \mathbf{J}^{-1} (\mathbf{J}^{-1})^T
                 \right)^{1/2}_{i, i}
                 s_i(\boldsymbol{p}).
+
+        For element-wise transformations this reduces to
+        :math:`s_i(\boldsymbol{q}) = s_i(\boldsymbol{p}) / |J_{i,i}|`.
         """
-        jac_inv = np.linalg.pinv(self.jacobian(q))
-        return s * np.sqrt(np.diagonal(np.matmul(jac_inv, jac_inv.T)))
+        if _is_elementwise(self):
+            return s * np.abs(_pinv_diag(self.jacobian_diag(q)))
+        jac_inv = self._jacobian_inverse(q)
+        # The diagonal of J^-1 (J^-1)^T contains the squared row norms of J^-1
+        return s * np.sqrt(np.sum(jac_inv ** 2, axis=1))
 
     def jacobian(self, q):
         r"""
@@ -150,6 +242,27 @@ class Transformation(object):
         """
         raise NotImplementedError
 
+    def jacobian_diag(self, q):
+        """
+        Returns the diagonal of the Jacobian matrix of the transformation
+        calculated at the parameter vector ``q`` in the search space.
+
+        For element-wise transformations (see
+        :meth:`Transformation.elementwise`) the Jacobian matrix is diagonal, so
+        this vector describes it fully and can be used instead of the
+        ``n_parameters`` by ``n_parameters`` matrix returned by
+        :meth:`Transformation.jacobian`.
+
+        The default implementation returns the diagonal of the full matrix
+        returned by :meth:`Transformation.jacobian`. Element-wise
+        transformations may reimplement this method to avoid creating the full
+        matrix.
+
+        *This is an optional method.* It is used by ``evaluateS1()`` of the
+        transformed wrapper classes when the transformation is element-wise.
+        """
+        return np.diagonal(self.jacobian(q))
+
     def jacobian_S1(self, q):
         r"""
         Computes the Jacobian matrix of the transformation calculated at the
@@ -173,8 +286,8 @@ class Transformation(object):
         Jacobian matrix of the transformation :meth:`Transformation.jacobian`
         calculated at the parameter vector ``q`` in the search space.
 
-        The default implementation numerically calculates the determinant of
-        the full matrix which only works if the optional method
+        The default implementation numerically calculates the log-determinant
+        of the full matrix which only works if the optional method
         :meth:`Transformation.jacobian` is implemented. If there is an analytic
         expression for the specific transformation, a reimplementation of this
         method may be preferred.
@@ -184,7 +297,7 @@ class Transformation(object):
         e.g. not necessary if it's used for :class:`ErrorMeasure` without
         :meth:`ErrorMeasure.evaluateS1()`.
         """
-        return np.log(np.abs(np.linalg.det(self.jacobian(q))))
+        return np.linalg.slogdet(self.jacobian(q))[1]
 
     def log_jacobian_det_S1(self, q):
         r"""
@@ -231,9 +344,9 @@ class Transformation(object):
         #
         q = pints.vector(q)
         jac, jac_S1 = self.jacobian_S1(q)
-        out_S1 = np.zeros(q.shape)
-        for i, jac_S1_i in enumerate(jac_S1):
-            out_S1[i] = np.trace(np.matmul(np.linalg.pinv(jac), jac_S1_i))
+        # Invert J once, and compute Tr(J^{-1} d/dq_k J) for all k at once
+        jac_inv = np.linalg.pinv(jac)
+        out_S1 = np.einsum('ij,kji->k', jac_inv, jac_S1)
         return self.log_jacobian_det(q), out_S1
 
     def n_parameters(self):
@@ -276,6 +389,97 @@ class Transformation(object):
         """
         raise NotImplementedError
 
+    def _jacobian_inverse(self, q):
+        """
+        Returns the (pseudo-)inverse of the Jacobian matrix at ``q``.
+
+        The default implementation inverts the diagonal for element-wise
+        transformations, and uses ``np.linalg.pinv`` otherwise.
+        """
+        if _is_elementwise(self):
+            return np.diag(_pinv_diag(self.jacobian_diag(q)))
+        return np.linalg.pinv(self.jacobian(q))
+
+    def _to_search_batch(self, ps):
+        """
+        Transforms an array ``ps`` of shape ``(n, n_parameters)``, containing
+        ``n`` parameter vectors in the model space, to the search space.
+
+        The default implementation calls :meth:`to_search()` for every row.
+        Transformations that can act on all rows at once may reimplement this
+        method.
+        """
+        return np.array([self.to_search(p) for p in ps])
+
+    def _to_model_batch(self, qs):
+        """
+        Transforms an array ``qs`` of shape ``(n, n_parameters)``, containing
+        ``n`` parameter vectors in the search space, to the model space.
+
+        The default implementation calls :meth:`to_model()` for every row.
+        Transformations that can act on all rows at once may reimplement this
+        method.
+        """
+        return np.array([self.to_model(q) for q in qs])
+
+    def _to_model_and_log_jacobian_det(self, q):
+        """
+        Returns a tuple ``(p, log_jacobian_det)`` with the result of
+        :meth:`to_model()` and :meth:`log_jacobian_det()` at ``q``.
+
+        The default implementation calls both methods. Transformations that
+        can share intermediate results between the two may reimplement this
+        method.
+        """
+        return self.to_model(q), self.log_jacobian_det(q)
+
+    def _to_model_and_log_jacobian_det_S1(self, q):
+        """
+        Returns a tuple ``(p, jacobian, log_jacobian_det, dlog_jacobian_det)``
+        with everything :class:`TransformedLogPDF` needs to evaluate a
+        gradient at ``q``.
+
+        Here ``p`` is the result of :meth:`to_model()`, ``jacobian`` is the
+        result of :meth:`jacobian_diag()` for element-wise transformations or
+        of :meth:`jacobian()` otherwise, and the last two entries are the
+        result of :meth:`log_jacobian_det_S1()`.
+
+        The default implementation calls these methods separately.
+        Transformations that can share intermediate results between them may
+        reimplement this method.
+        """
+        if _is_elementwise(self):
+            jacobian = self.jacobian_diag(q)
+        else:
+            jacobian = self.jacobian(q)
+        return (self.to_model(q), jacobian) + self.log_jacobian_det_S1(q)
+
+
+def _merge_transformations(t1, t2):
+    """
+    Returns a single transformation equivalent to ``t1`` followed by ``t2`` if
+    both are built-in element-wise transformations of the same type, or
+    ``None`` otherwise.
+    """
+    # Subclasses may change the behaviour, so check for exact types only
+    if type(t1) is not type(t2):
+        return None
+    if type(t1) in (
+            IdentityTransformation, LogTransformation, LogitTransformation):
+        return type(t1)(t1.n_parameters() + t2.n_parameters())
+    if type(t1) is RectangularBoundariesTransformation:
+        return RectangularBoundariesTransformation(
+            np.concatenate((t1._a, t2._a)), np.concatenate((t1._b, t2._b)))
+    if type(t1) is ScalingTransformation:
+        translation = None
+        if t1._translation is not None or t2._translation is not None:
+            translation = np.concatenate([
+                np.zeros(t.n_parameters()) if t._translation is None
+                else t._translation for t in (t1, t2)])
+        return ScalingTransformation(
+            np.concatenate((t1._s, t2._s)), translation)
+    return None
+
 
 class ComposedTransformation(Transformation):
     r"""
@@ -317,6 +521,7 @@ class ComposedTransformation(Transformation):
         # Check if proper Transformation, count dimension
         self._n_parameters = 0
         self._elementwise = True
+        flattened = []
         for transformation in transformations:
             if not isinstance(transformation, pints.Transformation):
                 raise ValueError('All entries in `transformations` must extend'
@@ -326,18 +531,41 @@ class ComposedTransformation(Transformation):
             # elementwise
             self._elementwise &= transformation.elementwise()
 
+            # Store the children of nested composed transformations directly,
+            # so that each evaluation needs only a single loop
+            if type(transformation) is ComposedTransformation:
+                children = transformation._transformations
+            else:
+                children = [transformation]
+
+            # Merge neighbouring transformations of the same built-in type,
+            # so that they are evaluated in a single call
+            for child in children:
+                merged = None
+                if flattened:
+                    merged = _merge_transformations(flattened[-1], child)
+                if merged is None:
+                    flattened.append(child)
+                else:
+                    flattened[-1] = merged
+
         # Store
-        self._transformations = transformations
+        self._transformations = tuple(flattened)
+
+        # Store each sub-transformation with the start and end index of its
+        # parameters, so that these don't need to be recomputed every call
+        self._blocks = []
+        hi = 0
+        for transformation in self._transformations:
+            lo = hi
+            hi += transformation.n_parameters()
+            self._blocks.append((transformation, lo, hi))
 
         # Use elementwise or not
         if self._elementwise:
             self._jacobian = self._elementwise_jacobian
-            self._log_jacobian_det = self._elementwise_log_jacobian_det
-            self._log_jacobian_det_S1 = self._elementwise_log_jacobian_det_S1
         else:
             self._jacobian = self._general_jacobian
-            self._log_jacobian_det = self._general_log_jacobian_det
-            self._log_jacobian_det_S1 = self._general_log_jacobian_det_S1
 
     def elementwise(self):
         """ See :meth:`Transformation.elementwise()`. """
@@ -347,56 +575,73 @@ class ComposedTransformation(Transformation):
         """ See :meth:`Transformation.jacobian()`. """
         return self._jacobian(q)
 
+    def jacobian_diag(self, q):
+        """ See :meth:`Transformation.jacobian_diag()`. """
+        # The Jacobian is block diagonal, so its diagonal consists of the
+        # diagonals of the sub-transformations' Jacobians
+        q = _vector(q)
+        diag = np.empty(q.shape)
+        for transformation, lo, hi in self._blocks:
+            diag[lo:hi] = transformation.jacobian_diag(q[lo:hi])
+        return diag
+
     def jacobian_S1(self, q):
         """ See :meth:`Transformation.jacobian_S1()`. """
-        q = pints.vector(q)
-        matrix_shape = (self.n_parameters(), self.n_parameters())
-        lo = hi = 0
-        output_S1 = np.zeros((self.n_parameters(),) + matrix_shape)
-        for transformation in self._transformations:
-            lo = hi
-            hi += transformation.n_parameters()
-            _, jac_S1 = transformation.jacobian_S1(q[lo:hi])
-            for i, jac_S1_i in enumerate(jac_S1):
-                # Due to the composed transformation are independent, we can
-                # pack the derivative of the Jacobian matrices J_i with zeros:
-                #
-                #     [ 0   0   0 ]
-                # J = [ 0  J_i  0 ]
-                #     [ 0   0   0 ]
-                #
-                o = np.zeros(matrix_shape)
-                o[lo:hi, lo:hi] = jac_S1_i[:, :]
-                output_S1[lo + i, :, :] = o
-        return self.jacobian(q), output_S1
+        q = _vector(q)
+        n = self._n_parameters
+        output = np.zeros((n, n))
+        output_S1 = np.zeros((n, n, n))
+        for transformation, lo, hi in self._blocks:
+            jac, jac_S1 = transformation.jacobian_S1(q[lo:hi])
+            # Due to the composed transformation are independent, the
+            # Jacobian is block diagonal (see _general_jacobian()), and the
+            # derivative of J w.r.t. the i-th parameter of a block is zero
+            # outside that block:
+            #
+            #           [ 0      0      0 ]
+            # dJ/dq_i = [ 0  dJ_k/dq_i  0 ]
+            #           [ 0      0      0 ]
+            #
+            output[lo:hi, lo:hi] = jac
+            output_S1[lo:hi, lo:hi, lo:hi] = jac_S1
+        return output, output_S1
 
     def log_jacobian_det(self, q):
         """ See :meth:`Transformation.log_jacobian_det()`. """
-        return self._log_jacobian_det(q)
+        # The Jacobian is block diagonal, so its log-determinant is the sum of
+        # the log-determinants of the blocks
+        q = _vector(q)
+        output = 0
+        for transformation, lo, hi in self._blocks:
+            output += transformation.log_jacobian_det(q[lo:hi])
+        return output
 
     def log_jacobian_det_S1(self, q):
         """ See :meth:`Transformation.log_jacobian_det_S1()`. """
-        return self._log_jacobian_det_S1(q)
+        # Each block's log-determinant depends only on the parameters in that
+        # block, so the derivatives can be computed block-wise too
+        q = _vector(q)
+        output = 0
+        output_S1 = np.empty(q.shape)
+        for transformation, lo, hi in self._blocks:
+            j, j_S1 = transformation.log_jacobian_det_S1(q[lo:hi])
+            output += j
+            output_S1[lo:hi] = np.asarray(j_S1)
+        return output, output_S1
 
     def to_model(self, q):
         """ See :meth:`Transformation.to_model()`. """
-        q = pints.vector(q)
-        output = np.zeros(q.shape)
-        lo = hi = 0
-        for transformation in self._transformations:
-            lo = hi
-            hi += transformation.n_parameters()
+        q = _vector(q)
+        output = np.empty(q.shape)
+        for transformation, lo, hi in self._blocks:
             output[lo:hi] = np.asarray(transformation.to_model(q[lo:hi]))
         return output
 
     def to_search(self, p):
         """ See :meth:`Transformation.to_search()`. """
-        p = pints.vector(p)
-        output = np.zeros(p.shape)
-        lo = hi = 0
-        for transformation in self._transformations:
-            lo = hi
-            hi += transformation.n_parameters()
+        p = _vector(p)
+        output = np.empty(p.shape)
+        for transformation, lo, hi in self._blocks:
             output[lo:hi] = np.asarray(transformation.to_search(p[lo:hi]))
         return output
 
@@ -404,91 +649,86 @@ class ComposedTransformation(Transformation):
         """ See :meth:`Transformation.n_parameters()`. """
         return self._n_parameters
 
-    def _elementwise_jacobian(self, q):
-        """
-        Element-wise implementation of :meth:`Transformation.jacobian()`.
-        """
-        q = pints.vector(q)
-        diag = np.zeros(q.shape)
-        lo = hi = 0
-        for transformation in self._transformations:
-            lo = hi
-            hi += transformation.n_parameters()
-            diag[lo:hi] = np.diagonal(transformation.jacobian(q[lo:hi]))
-        output = np.diag(diag)
+    def _jacobian_inverse(self, q):
+        """ See :meth:`Transformation._jacobian_inverse()`. """
+        # The inverse of a block diagonal matrix is block diagonal, with the
+        # inverses of the blocks on the diagonal
+        q = _vector(q)
+        output = np.zeros((self._n_parameters, self._n_parameters))
+        for transformation, lo, hi in self._blocks:
+            output[lo:hi, lo:hi] = transformation._jacobian_inverse(q[lo:hi])
+        return output
+
+    def _to_search_batch(self, ps):
+        """ See :meth:`Transformation._to_search_batch()`. """
+        ps = np.asarray(ps, dtype=float)
+        output = np.empty(ps.shape)
+        for transformation, lo, hi in self._blocks:
+            output[:, lo:hi] = transformation._to_search_batch(ps[:, lo:hi])
+        return output
+
+    def _to_model_batch(self, qs):
+        """ See :meth:`Transformation._to_model_batch()`. """
+        qs = np.asarray(qs, dtype=float)
+        output = np.empty(qs.shape)
+        for transformation, lo, hi in self._blocks:
+            output[:, lo:hi] = transformation._to_model_batch(qs[:, lo:hi])
         return output
 
-    def _elementwise_log_jacobian_det(self, q):
+    def _to_model_and_log_jacobian_det(self, q):
         """
-        Element-wise implementation of
-        :meth:`Transformation.log_jacobian_det()`.
+        See :meth:`Transformation._to_model_and_log_jacobian_det()`.
         """
-        q = pints.vector(q)
-        output = 0
-        lo = hi = 0
-        for transformation in self._transformations:
-            lo = hi
-            hi += transformation.n_parameters()
-            output += transformation.log_jacobian_det(q[lo:hi])
-        return output
+        q = _vector(q)
+        output = np.empty(q.shape)
+        output_det = 0
+        for transformation, lo, hi in self._blocks:
+            output[lo:hi], j = \
+                transformation._to_model_and_log_jacobian_det(q[lo:hi])
+            output_det += j
+        return output, output_det
+
+    def _to_model_and_log_jacobian_det_S1(self, q):
+        """
+        See :meth:`Transformation._to_model_and_log_jacobian_det_S1()`.
+        """
+        if not self._elementwise:
+            return super()._to_model_and_log_jacobian_det_S1(q)
+
+        q = _vector(q)
+        output = np.empty(q.shape)
+        output_jac = np.empty(q.shape)
+        output_det = 0
+        output_det_S1 = np.empty(q.shape)
+        for transformation, lo, hi in self._blocks:
+            output[lo:hi], output_jac[lo:hi], j, output_det_S1[lo:hi] = \
+                transformation._to_model_and_log_jacobian_det_S1(q[lo:hi])
+            output_det += j
+        return output, output_jac, output_det, output_det_S1
 
-    def _elementwise_log_jacobian_det_S1(self, q):
+    def _elementwise_jacobian(self, q):
         """
-        Element-wise implementation of
-        :meth:`Transformation.log_jacobian_det_S1()`.
+        Element-wise implementation of :meth:`Transformation.jacobian()`.
         """
-        q = pints.vector(q)
-        output = 0
-        output_S1 = np.zeros(q.shape)
-        lo = hi = 0
-        for transformation in self._transformations:
-            lo = hi
-            hi += transformation.n_parameters()
-            j, j_S1 = transformation.log_jacobian_det_S1(q[lo:hi])
-            output += j
-            output_S1[lo:hi] = np.asarray(j_S1)
-        return output, output_S1
+        return np.diag(self.jacobian_diag(q))
 
     def _general_jacobian(self, q):
         """
         General implementation of :meth:`Transformation.jacobian()`.
         """
-        q = pints.vector(q)
-        lo, hi = 0, self._transformations[0].n_parameters()
-        output = self._transformations[0].jacobian(q[lo:hi])
-        for transformation in self._transformations[1:]:
-            lo = hi
-            hi += transformation.n_parameters()
-            jaco = transformation.jacobian(q[lo:hi])
-            # Due to the composed transformation are independent, we can stack
-            # the Jacobian matrices J_i and J_{i+1} as
+        q = _vector(q)
+        output = np.zeros((self._n_parameters, self._n_parameters))
+        for transformation, lo, hi in self._blocks:
+            # Due to the composed transformation are independent, we can place
+            # the Jacobian matrices J_i on the diagonal blocks
             #
-            # J = [ J_i     0    ]
-            #     [  0   J_{i+1} ]
+            #     [ J_1  0   0  ]
+            # J = [  0  J_2  0  ]
+            #     [  0   0  J_3 ]
             #
-            pack = np.zeros((output.shape[0], jaco.shape[1]))
-            output = np.block([[output, pack], [pack.T, jaco]])
+            output[lo:hi, lo:hi] = transformation.jacobian(q[lo:hi])
         return output
 
-    def _general_log_jacobian_det(self, q):
-        """
-        General implementation of :meth:`Transformation.log_jacobian_det()`.
-        """
-        # The same as in Transformation.log_jacobian_det()
-        return np.log(np.abs(np.linalg.det(self.jacobian(q))))
-
-    def _general_log_jacobian_det_S1(self, q):
-        """
-        General implementation of :meth:`Transformation.log_jacobian_det_S1()`.
-        """
-        # The same as in Transformation.log_jacobian_det_S1()
-        q = pints.vector(q)
-        jac, jac_S1 = self.jacobian_S1(q)
-        out_S1 = np.zeros(q.shape)
-        for i, jac_S1_i in enumerate(jac_S1):
-            out_S1[i] = np.trace(np.matmul(np.linalg.pinv(jac), jac_S1_i))
-        return self.log_jacobian_det(q), out_S1
-
 
 class IdentityTransformation(Transformation):
     """
@@ -496,6 +736,9 @@ class IdentityTransformation(Transformation):
     i.e. the search space under this transformation is the same as the model
     space. And its Jacobian matrix is the identity matrix.
 
+    The constant arrays returned by :meth:`jacobian()`, :meth:`jacobian_S1()`
+    and :meth:`log_jacobian_det_S1()` are read-only, and shared between calls.
+
     Extends :class:`Transformation`.
 
     Parameters
@@ -506,18 +749,38 @@ class IdentityTransformation(Transformation):
     def __init__(self, n_parameters):
         self._n_parameters = n_parameters
 
+        # The Jacobian and the derivative of the log-Jacobian determinant are
+        # constant, so they are stored as read-only arrays
+        self._eye = np.eye(n_parameters)
+        self._eye.setflags(write=False)
+        self._zeros = np.zeros(n_parameters)
+        self._zeros.setflags(write=False)
+
+        # The (n, n, n) derivative of the Jacobian is created on first use
+        self._zeros_S1 = None
+
     def elementwise(self):
         """ See :meth:`Transformation.elementwise()`. """
         return True
 
     def jacobian(self, q):
         """ See :meth:`Transformation.jacobian()`. """
-        return np.eye(self._n_parameters)
+        return self._eye
+
+    def jacobian_diag(self, q):
+        """ See :meth:`Transformation.jacobian_diag()`. """
+        # Subclasses may reimplement jacobian(), so use it if they do
+        if _overridden(self, IdentityTransformation, 'jacobian'):
+            return super().jacobian_diag(q)
+        return np.ones(self._n_parameters)
 
     def jacobian_S1(self, q):
         """ See :meth:`Transformation.jacobian_S1()`. """
-        n = self._n_parameters
-        return self.jacobian(q), np.zeros((n, n, n))
+        if self._zeros_S1 is None:
+            n = self._n_parameters
+            self._zeros_S1 = np.zeros((n, n, n))
+            self._zeros_S1.setflags(write=False)
+        return self.jacobian(q), self._zeros_S1
 
     def log_jacobian_det(self, q):
         """ See :meth:`Transformation.log_jacobian_det()`. """
@@ -525,7 +788,7 @@ class IdentityTransformation(Transformation):
 
     def log_jacobian_det_S1(self, q):
         """ See :meth:`Transformation.log_jacobian_det_S1()`. """
-        return self.log_jacobian_det(q), np.zeros(self._n_parameters)
+        return 0., self._zeros
 
     def n_parameters(self):
         """ See :meth:`Transformation.n_parameters()`. """
@@ -539,6 +802,20 @@ class IdentityTransformation(Transformation):
         """ See :meth:`Transformation.to_search()`. """
         return pints.vector(p)
 
+    def _to_search_batch(self, ps):
+        """ See :meth:`Transformation._to_search_batch()`. """
+        # Subclasses may reimplement to_search(), so use it if they do
+        if _overridden(self, IdentityTransformation, 'to_search'):
+            return super()._to_search_batch(ps)
+        return np.array(ps, copy=True, dtype=float)
+
+    def _to_model_batch(self, qs):
+        """ See :meth:`Transformation._to_model_batch()`. """
+        # Subclasses may reimplement to_model(), so use it if they do
+        if _overridden(self, IdentityTransformation, 'to_model'):
+            return super()._to_model_batch(qs)
+        return np.array(qs, copy=True, dtype=float)
+
 
 class LogitTransformation(Transformation):
     r"""
@@ -586,29 +863,41 @@ class LogitTransformation(Transformation):
 
     def jacobian(self, q):
         """ See :meth:`Transformation.jacobian()`. """
-        q = pints.vector(q)
-        return np.diag(expit(q) * (1. - expit(q)))
+        return np.diag(_expit_derivative(_vector(q)))
+
+    def jacobian_diag(self, q):
+        """ See :meth:`Transformation.jacobian_diag()`. """
+        # Subclasses may reimplement jacobian(), so use it if they do
+        if _overridden(self, LogitTransformation, 'jacobian'):
+            return super().jacobian_diag(q)
+        return _expit_derivative(_vector(q))
 
     def jacobian_S1(self, q):
         """ See :meth:`Transformation.jacobian_S1()`. """
-        q = pints.vector(q)
+        q = _vector(q)
         n = self._n_parameters
-        jac = self.jacobian(q)
+        diag = _expit_derivative(q)
         jac_S1 = np.zeros((n, n, n))
         rn = np.arange(n)
-        jac_S1[rn, rn, rn] = np.diagonal(jac) * (np.exp(-q) - 1.) * expit(q)
-        return jac, jac_S1
+        # (exp(-q) - 1) * expit(q) = 1 - 2 * expit(q) = -tanh(q / 2), where
+        # the last form does not suffer from cancellation near q = 0
+        jac_S1[rn, rn, rn] = diag * -np.tanh(0.5 * q)
+        return np.diag(diag), jac_S1
 
     def log_jacobian_det(self, q):
         """ See :meth:`Transformation.log_jacobian_det()`. """
-        q = pints.vector(q)
-        return np.sum(np.log(expit(q)) + np.log(1. - expit(q)))
+        q = _vector(q)
+        # log(expit(q)) + log(1 - expit(q)) = -q - 2 * softplus(-q), which
+        # avoids taking the log of values that underflow to zero
+        return -np.sum(q + 2. * np.logaddexp(0., -q))
 
     def log_jacobian_det_S1(self, q):
         """ See :meth:`Transformation.log_jacobian_det_S1()`. """
-        q = pints.vector(q)
-        logjacdet = self.log_jacobian_det(q)
-        dlogjacdet = 2. * np.exp(-q) * expit(q) - 1.
+        q = _vector(q)
+        p, s = _expit_and_softplus(q)
+        logjacdet = -np.sum(q + 2. * s)
+        # 2 * exp(-q) * expit(q) - 1 = 1 - 2 * expit(q), without overflow
+        dlogjacdet = 1. - 2. * p
         return logjacdet, dlogjacdet
 
     def n_parameters(self):
@@ -617,14 +906,55 @@ class LogitTransformation(Transformation):
 
     def to_model(self, q):
         """ See :meth:`Transformation.to_model()`. """
-        q = pints.vector(q)
+        q = _vector(q)
         return expit(q)
 
     def to_search(self, p):
         """ See :meth:`Transformation.to_search()`. """
-        p = pints.vector(p)
+        p = _vector(p)
         return logit(p)
 
+    def _to_search_batch(self, ps):
+        """ See :meth:`Transformation._to_search_batch()`. """
+        # Subclasses may reimplement to_search(), so use it if they do
+        if _overridden(self, LogitTransformation, 'to_search'):
+            return super()._to_search_batch(ps)
+        return logit(np.asarray(ps, dtype=float))
+
+    def _to_model_batch(self, qs):
+        """ See :meth:`Transformation._to_model_batch()`. """
+        # Subclasses may reimplement to_model(), so use it if they do
+        if _overridden(self, LogitTransformation, 'to_model'):
+            return super()._to_model_batch(qs)
+        return expit(np.asarray(qs, dtype=float))
+
+    def _to_model_and_log_jacobian_det(self, q):
+        """
+        See :meth:`Transformation._to_model_and_log_jacobian_det()`.
+        """
+        # Subclasses may reimplement the methods combined here, so use them if
+        # they do
+        if _overridden(
+                self, LogitTransformation, 'to_model', 'log_jacobian_det'):
+            return super()._to_model_and_log_jacobian_det(q)
+        q = _vector(q)
+        p, s = _expit_and_softplus(q)
+        return p, -np.sum(q + 2. * s)
+
+    def _to_model_and_log_jacobian_det_S1(self, q):
+        """
+        See :meth:`Transformation._to_model_and_log_jacobian_det_S1()`.
+        """
+        # Subclasses may reimplement the methods combined here, so use them if
+        # they do
+        if _overridden(self, LogitTransformation, 'to_model', 'jacobian',
+                       'jacobian_diag', 'log_jacobian_det',
+                       'log_jacobian_det_S1'):
+            return super()._to_model_and_log_jacobian_det_S1(q)
+        q = _vector(q)
+        p, s, d = _expit_softplus_and_derivative(q)
+        return p, d, -np.sum(q + 2. * s), 1. - 2. * p
+
 
 class LogTransformation(Transformation):
     r"""
@@ -653,6 +983,9 @@ class LogTransformation(Transformation):
     .. math::
         \frac{d}{dq} \log(|J(q)|) = 1.
 
+    The constant derivative returned by :meth:`log_jacobian_det_S1()` is a
+    read-only array, shared between calls.
+
     Extends :class:`Transformation`.
 
     Parameters
@@ -663,36 +996,45 @@ class LogTransformation(Transformation):
     def __init__(self, n_parameters):
         self._n_parameters = n_parameters
 
+        # The derivative of the log-Jacobian determinant is constant, so a
+        # single read-only array is returned by log_jacobian_det_S1
+        self._ones = np.ones(n_parameters)
+        self._ones.setflags(write=False)
+
     def elementwise(self):
         """ See :meth:`Transformation.elementwise()`. """
         return True
 
     def jacobian(self, q):
         """ See :meth:`Transformation.jacobian()`. """
-        q = pints.vector(q)
-        return np.diag(np.exp(q))
+        return np.diag(np.exp(_vector(q)))
+
+    def jacobian_diag(self, q):
+        """ See :meth:`Transformation.jacobian_diag()`. """
+        # Subclasses may reimplement jacobian(), so use it if they do
+        if _overridden(self, LogTransformation, 'jacobian'):
+            return super().jacobian_diag(q)
+        return np.exp(_vector(q))
 
     def jacobian_S1(self, q):
         """ See :meth:`Transformation.jacobian_S1()`. """
-        q = pints.vector(q)
+        q = _vector(q)
         n = self._n_parameters
-        jac = self.jacobian(q)
+        diag = np.exp(q)
         jac_S1 = np.zeros((n, n, n))
         rn = np.arange(n)
-        jac_S1[rn, rn, rn] = np.diagonal(jac)
-        return jac, jac_S1
+        jac_S1[rn, rn, rn] = diag
+        return np.diag(diag), jac_S1
 
     def log_jacobian_det(self, q):
         """ See :meth:`Transformation.log_jacobian_det()`. """
-        q = pints.vector(q)
+        q = _vector(q)
         return np.sum(q)
 
     def log_jacobian_det_S1(self, q):
         """ See :meth:`Transformation.log_jacobian_det_S1()`. """
-        q = pints.vector(q)
-        logjacdet = self.log_jacobian_det(q)
-        dlogjacdet = np.ones(self._n_parameters)
-        return logjacdet, dlogjacdet
+        q = _vector(q)
+        return np.sum(q), self._ones
 
     def n_parameters(self):
         """ See :meth:`Transformation.n_parameters()`. """
@@ -700,14 +1042,55 @@ class LogTransformation(Transformation):
 
     def to_model(self, q):
         """ See :meth:`Transformation.to_model()`. """
-        q = pints.vector(q)
+        q = _vector(q)
         return np.exp(q)
 
     def to_search(self, p):
         """ See :meth:`Transformation.to_search()`. """
-        p = pints.vector(p)
+        p = _vector(p)
         return np.log(p)
 
+    def _to_search_batch(self, ps):
+        """ See :meth:`Transformation._to_search_batch()`. """
+        # Subclasses may reimplement to_search(), so use it if they do
+        if _overridden(self, LogTransformation, 'to_search'):
+            return super()._to_search_batch(ps)
+        return np.log(np.asarray(ps, dtype=float))
+
+    def _to_model_batch(self, qs):
+        """ See :meth:`Transformation._to_model_batch()`. """
+        # Subclasses may reimplement to_model(), so use it if they do
+        if _overridden(self, LogTransformation, 'to_model'):
+            return super()._to_model_batch(qs)
+        return np.exp(np.asarray(qs, dtype=float))
+
+    def _to_model_and_log_jacobian_det(self, q):
+        """
+        See :meth:`Transformation._to_model_and_log_jacobian_det()`.
+        """
+        # Subclasses may reimplement the methods combined here, so use them if
+        # they do
+        if _overridden(
+                self, LogTransformation, 'to_model', 'log_jacobian_det'):
+            return super()._to_model_and_log_jacobian_det(q)
+        q = _vector(q)
+        return np.exp(q), np.sum(q)
+
+    def _to_model_and_log_jacobian_det_S1(self, q):
+        """
+        See :meth:`Transformation._to_model_and_log_jacobian_det_S1()`.
+        """
+        # Subclasses may reimplement the methods combined here, so use them if
+        # they do
+        if _overridden(self, LogTransformation, 'to_model', 'jacobian',
+                       'jacobian_diag', 'log_jacobian_det',
+                       'log_jacobian_det_S1'):
+            return super()._to_model_and_log_jacobian_det_S1(q)
+        # The Jacobian diagonal is equal to the transformed point
+        q = _vector(q)
+        p = np.exp(q)
+        return p, p, np.sum(q), self._ones
+
 
 class RectangularBoundariesTransformation(Transformation):
     r"""
@@ -781,6 +1164,10 @@ class RectangularBoundariesTransformation(Transformation):
         self._a = boundaries.lower()
         self._b = boundaries.upper()
 
+        # Cache the interval widths and the sum of their logs
+        self._range = self._b - self._a
+        self._sum_log_range = float(np.sum(np.log(self._range)))
+
         # Cache dimension
         self._n_parameters = boundaries.n_parameters()
         del boundaries
@@ -791,31 +1178,39 @@ class RectangularBoundariesTransformation(Transformation):
 
     def jacobian(self, q):
         """ See :meth:`Transformation.jacobian()`. """
-        q = pints.vector(q)
-        diag = (self._b - self._a) / (np.exp(q) * (1. + np.exp(-q)) ** 2)
-        return np.diag(diag)
+        return np.diag(self._range * _expit_derivative(_vector(q)))
+
+    def jacobian_diag(self, q):
+        """ See :meth:`Transformation.jacobian_diag()`. """
+        # Subclasses may reimplement jacobian(), so use it if they do
+        if _overridden(self, RectangularBoundariesTransformation, 'jacobian'):
+            return super().jacobian_diag(q)
+        return self._range * _expit_derivative(_vector(q))
 
     def jacobian_S1(self, q):
         """ See :meth:`Transformation.jacobian_S1()`. """
-        q = pints.vector(q)
+        q = _vector(q)
         n = self._n_parameters
-        jac = self.jacobian(q)
+        diag = self._range * _expit_derivative(q)
         jac_S1 = np.zeros((n, n, n))
         rn = np.arange(n)
-        jac_S1[rn, rn, rn] = np.diagonal(jac) * (np.exp(-q) - 1.) * expit(q)
-        return jac, jac_S1
+        # See LogitTransformation.jacobian_S1()
+        jac_S1[rn, rn, rn] = diag * -np.tanh(0.5 * q)
+        return np.diag(diag), jac_S1
 
     def log_jacobian_det(self, q):
         """ See :meth:`Transformation.log_jacobian_det()`. """
-        q = pints.vector(q)
-        s = self._softplus(-q)
-        return np.sum(np.log(self._b - self._a) - 2. * s - q)
+        q = _vector(q)
+        s = np.logaddexp(0., -q)    # softplus(-q)
+        return self._sum_log_range - np.sum(2. * s + q)
 
     def log_jacobian_det_S1(self, q):
         """ See :meth:`Transformation.log_jacobian_det_S1()`. """
-        q = pints.vector(q)
-        logjacdet = self.log_jacobian_det(q)
-        dlogjacdet = 2. * np.exp(-q) * expit(q) - 1.
+        q = _vector(q)
+        p, s = _expit_and_softplus(q)
+        logjacdet = self._sum_log_range - np.sum(2. * s + q)
+        # 2 * exp(-q) * expit(q) - 1 = 1 - 2 * expit(q), without overflow
+        dlogjacdet = 1. - 2. * p
         return logjacdet, dlogjacdet
 
     def n_parameters(self):
@@ -824,17 +1219,58 @@ class RectangularBoundariesTransformation(Transformation):
 
     def to_model(self, q):
         """ See :meth:`Transformation.to_model()`. """
-        q = pints.vector(q)
-        return (self._b - self._a) * expit(q) + self._a
+        q = _vector(q)
+        return self._range * expit(q) + self._a
 
     def to_search(self, p):
-        p = pints.vector(p)
+        p = _vector(p)
         """ See :meth:`Transformation.to_search()`. """
         return np.log(p - self._a) - np.log(self._b - p)
 
-    def _softplus(self, q):
-        """ Returns the softplus function. """
-        return np.log(1. + np.exp(q))
+    def _to_search_batch(self, ps):
+        """ See :meth:`Transformation._to_search_batch()`. """
+        # Subclasses may reimplement to_search(), so use it if they do
+        if _overridden(self, RectangularBoundariesTransformation, 'to_search'):
+            return super()._to_search_batch(ps)
+        ps = np.asarray(ps, dtype=float)
+        return np.log(ps - self._a) - np.log(self._b - ps)
+
+    def _to_model_batch(self, qs):
+        """ See :meth:`Transformation._to_model_batch()`. """
+        # Subclasses may reimplement to_model(), so use it if they do
+        if _overridden(self, RectangularBoundariesTransformation, 'to_model'):
+            return super()._to_model_batch(qs)
+        return self._range * expit(np.asarray(qs, dtype=float)) + self._a
+
+    def _to_model_and_log_jacobian_det(self, q):
+        """
+        See :meth:`Transformation._to_model_and_log_jacobian_det()`.
+        """
+        # Subclasses may reimplement the methods combined here, so use them if
+        # they do
+        if _overridden(self, RectangularBoundariesTransformation,
+                       'to_model', 'log_jacobian_det'):
+            return super()._to_model_and_log_jacobian_det(q)
+        q = _vector(q)
+        p, s = _expit_and_softplus(q)
+        logjacdet = self._sum_log_range - np.sum(2. * s + q)
+        return self._range * p + self._a, logjacdet
+
+    def _to_model_and_log_jacobian_det_S1(self, q):
+        """
+        See :meth:`Transformation._to_model_and_log_jacobian_det_S1()`.
+        """
+        # Subclasses may reimplement the methods combined here, so use them if
+        # they do
+        if _overridden(self, RectangularBoundariesTransformation,
+                       'to_model', 'jacobian', 'jacobian_diag',
+                       'log_jacobian_det', 'log_jacobian_det_S1'):
+            return super()._to_model_and_log_jacobian_det_S1(q)
+        q = _vector(q)
+        p, s, d = _expit_softplus_and_derivative(q)
+        logjacdet = self._sum_log_range - np.sum(2. * s + q)
+        return self._range * p + self._a, self._range * d, logjacdet, \
+            1. - 2. * p
 
 
 class ScalingTransformation(Transformation):
@@ -848,7 +1284,9 @@ class ScalingTransformation(Transformation):
         q = (p + translation) * scalings
 
     Its Jacobian matrix is a diagonal matrix with ``1 / scalings`` on the
-    diagonal.
+    diagonal. The constant arrays returned by :meth:`jacobian()`,
+    :meth:`jacobian_diag()`, :meth:`jacobian_S1()` and
+    :meth:`log_jacobian_det_S1()` are read-only, and shared between calls.
 
     Extends :class:`Transformation`.
     """
@@ -865,26 +1303,49 @@ class ScalingTransformation(Transformation):
                     'Translation must be None or be a vector of the same'
                     ' length as the scalings.')
 
+        # The Jacobian, its log-determinant, and the derivative of the
+        # log-determinant are all constant, so they are stored as read-only
+        # arrays
+        self._inv_s.setflags(write=False)
+        self._jacobian = np.diag(self._inv_s)
+        self._jacobian.setflags(write=False)
+        self._log_jacobian_det = float(np.sum(np.log(np.abs(self._inv_s))))
+        self._zeros = np.zeros(self._n_parameters)
+        self._zeros.setflags(write=False)
+
+        # The (n, n, n) derivative of the Jacobian is created on first use
+        self._zeros_S1 = None
+
     def elementwise(self):
         """ See :meth:`Transformation.elementwise()`. """
         return True
 
     def jacobian(self, q):
         """ See :meth:`Transformation.jacobian()`. """
-        return np.diag(self._inv_s)
+        return self._jacobian
+
+    def jacobian_diag(self, q):
+        """ See :meth:`Transformation.jacobian_diag()`. """
+        # Subclasses may reimplement jacobian(), so use it if they do
+        if _overridden(self, ScalingTransformation, 'jacobian'):
+            return super().jacobian_diag(q)
+        return self._inv_s
 
     def jacobian_S1(self, q):
         """ See :meth:`Transformation.jacobian_S1()`. """
-        n = self._n_parameters
-        return self.jacobian(q), np.zeros((n, n, n))
+        if self._zeros_S1 is None:
+            n = self._n_parameters
+            self._zeros_S1 = np.zeros((n, n, n))
+            self._zeros_S1.setflags(write=False)
+        return self.jacobian(q), self._zeros_S1
 
     def log_jacobian_det(self, q):
         """ See :meth:`Transformation.log_jacobian_det()`. """
-        return np.sum(np.log(np.abs(self._inv_s)))
+        return self._log_jacobian_det
 
     def log_jacobian_det_S1(self, q):
         """ See :meth:`Transformation.log_jacobian_det_S1()`. """
-        return self.log_jacobian_det(q), np.zeros(self._n_parameters)
+        return self._log_jacobian_det, self._zeros
 
     def n_parameters(self):
         """ See :meth:`Transformation.n_parameters()`. """
@@ -892,18 +1353,38 @@ class ScalingTransformation(Transformation):
 
     def to_model(self, q):
         """ See :meth:`Transformation.to_model()`. """
-        p = self._inv_s * pints.vector(q)
+        p = self._inv_s * _vector(q)
         if self._translation is not None:
             p -= self._translation
         return p
 
     def to_search(self, p):
         """ See :meth:`Transformation.to_search()`. """
-        p = pints.vector(p)
+        p = _vector(p)
         if self._translation is not None:
             p = p + self._translation
         return self._s * p
 
+    def _to_search_batch(self, ps):
+        """ See :meth:`Transformation._to_search_batch()`. """
+        # Subclasses may reimplement to_search(), so use it if they do
+        if _overridden(self, ScalingTransformation, 'to_search'):
+            return super()._to_search_batch(ps)
+        ps = np.asarray(ps, dtype=float)
+        if self._translation is not None:
+            ps = ps + self._translation
+        return self._s * ps
+
+    def _to_model_batch(self, qs):
+        """ See :meth:`Transformation._to_model_batch()`. """
+        # Subclasses may reimplement to_model(), so use it if they do
+        if _overridden(self, ScalingTransformation, 'to_model'):
+            return super()._to_model_batch(qs)
+        ps = self._inv_s * np.asarray(qs, dtype=float)
+        if self._translation is not None:
+            ps -= self._translation
+        return ps
+
 
 class TransformedBoundaries(pints.Boundaries):
     """
@@ -1060,8 +1541,13 @@ class TransformedErrorMeasure(pints.ErrorMeasure):
         # (\nabla_q E)^T = J_(E.g) = J_(E(p)) J_(g) = (\nabla_p E)^T J_(g)
         # (\nabla denotes the del operator)
         #
-        jacobian = self._transform.jacobian(q)
-        de = np.matmul(de_nojac, jacobian)  # Jacobian must be the second term
+        # For element-wise transformations J is diagonal, so that the product
+        # reduces to an element-wise multiplication with its diagonal
+        if _is_elementwise(self._transform):
+            de = de_nojac * self._transform.jacobian_diag(q)
+        else:
+            jacobian = self._transform.jacobian(q)
+            de = np.dot(de_nojac, jacobian)  # Jacobian must be 2nd term
 
         return e, de
 
@@ -1135,29 +1621,42 @@ class TransformedLogPDF(pints.LogPDF):
             raise ValueError('Number of parameters for log_pdf and '
                              'transformation must match.')
 
+        # Samplers often call __call__ and evaluateS1 on the same point, so
+        # the transformed point and log-Jacobian determinant of the last call
+        # are cached
+        self._cached_q = None
+        self._cached_p = None
+        self._cached_logjacdet = None
+
     def __call__(self, q):
-        # Get parameters in the model space
-        p = self._transform.to_model(q)
+        q = pints.vector(q)
+        if self._cached_q is not None and np.array_equal(q, self._cached_q):
+            p, log_jacobian_det = self._cached_p, self._cached_logjacdet
+        else:
+            # Get parameters in the model space, and the log-Jacobian
+            # determinant to calculate the PDF using change of variable
+            # Wikipedia: https://w.wiki/UsJ
+            p, log_jacobian_det = \
+                self._transform._to_model_and_log_jacobian_det(q)
+            p = self._update_cache(q, p, log_jacobian_det)
 
         # Compute LogPDF in the model space
         logpdf_nojac = self._log_pdf(p)
-
-        # Calculate the PDF using change of variable
-        # Wikipedia: https://w.wiki/UsJ
-        log_jacobian_det = self._transform.log_jacobian_det(q)
         return logpdf_nojac + log_jacobian_det
 
     def evaluateS1(self, q):
         """ See :meth:`LogPDF.evaluateS1()`. """
-        # Get parameters in the model space
-        p = self._transform.to_model(q)
+        q = pints.vector(q)
+
+        # Get parameters in the model space, along with the Jacobian (or its
+        # diagonal), the log Jacobian, and its derivatives
+        p, jacobian, logjacdet, dlogjacdet = \
+            self._transform._to_model_and_log_jacobian_det_S1(q)
+        p = self._update_cache(q, p, logjacdet)
 
         # Compute evaluateS1 of LogPDF in the model space
         logpdf_nojac, dlogpdf_nojac = self._log_pdf.evaluateS1(p)
 
-        # Compute log Jacobian and its derivatives
-        logjacdet, dlogjacdet = self._transform.log_jacobian_det_S1(q)
-
         # Calculate the PDF change of variable, see self.__call__()
         logpdf = logpdf_nojac + logjacdet
 
@@ -1170,9 +1669,13 @@ class TransformedLogPDF(pints.LogPDF):
         # (\nabla_q E)^T = J_(E.g) = J_(E(p)) J_(g) = (\nabla_p E)^T J_(g)
         # (\nabla denotes the del operator)
         #
-        jacobian = self._transform.jacobian(q)
-        dlogpdf = np.matmul(dlogpdf_nojac, jacobian)  # Jacobian must be 2nd
-        dlogpdf += pints.vector(dlogjacdet)
+        # For element-wise transformations J is diagonal, so that the product
+        # reduces to an element-wise multiplication with its diagonal
+        if _is_elementwise(self._transform):
+            dlogpdf = dlogpdf_nojac * jacobian
+        else:
+            dlogpdf = np.dot(dlogpdf_nojac, jacobian)  # J must be 2nd
+        dlogpdf += dlogjacdet
 
         return logpdf, dlogpdf
 
@@ -1180,6 +1683,20 @@ class TransformedLogPDF(pints.LogPDF):
         """ See :meth:`LogPDF.n_parameters()`. """
         return self._n_parameters
 
+    def _update_cache(self, q, p, logjacdet):
+        """
+        Stores ``p`` and ``logjacdet`` as the results for ``q``, and returns a
+        read-only version of ``p``.
+        """
+        # Freeze a view, so that arrays owned by the transformation (which
+        # may be shared with e.g. the returned Jacobian) stay writeable
+        p = np.asarray(p).view()
+        p.setflags(write=False)
+        self._cached_q = q
+        self._cached_p = p
+        self._cached_logjacdet = logjacdet
+        return p
+
 
 class TransformedLogPrior(TransformedLogPDF, pints.LogPrior):
     """
@@ -1205,11 +1722,7 @@ class TransformedLogPrior(TransformedLogPDF, pints.LogPrior):
         *Note that this does not sample from the transformed log-prior but
         simply transforms the samples from the original log-prior.*
         """
-        ps = self._log_pdf.sample(n)
-        qs = np.zeros(ps.shape)
-        for i, p in enumerate(ps):
-            qs[i, :] = self._transform.to_search(p)
-        return qs
+        return self._transform._to_search_batch(self._log_pdf.sample(n))
 
 
 class UnitCubeTransformation(ScalingTransformation):
@@ -15,6 +15,8 @@ import pints
 import pints.toy as toy
 import pints.toy.stochastic
 
+from shared import StreamCapture
+
 
 class TestABCSMC(unittest.TestCase):
     """
@@ -125,6 +127,63 @@ class TestABCSMC(unittest.TestCase):
             self.log_prior,
             np.array([0]))
 
+    def test_log_weights(self):
+        # Tests the batched Gaussian kernel gives the same weights as calling
+        # an arbitrary kernel for every pair of particles
+        class Kernel(pints.MultivariateGaussianLogPrior):
+            pass
+
+        mean = [0.01, -0.02]
+        cov = [[0.01, 0.004], [0.004, 0.02]]
+        log_prior = pints.UniformLogPrior([0, 0], [1, 1])
+        abc1 = pints.ABCSMC(
+            log_prior, pints.MultivariateGaussianLogPrior(mean, cov))
+        abc2 = pints.ABCSMC(log_prior, Kernel(mean, cov))
+
+        np.random.seed(1)
+        new_samples = np.random.uniform(0, 1, size=(5, 2))
+        old_samples = np.random.uniform(0, 1, size=(7, 2))
+        new_log_priors = list(np.random.normal(size=5))
+        log_old_weights = np.log(np.random.dirichlet(np.ones(7)))
+        w1 = abc1._calculate_log_weights(
+            new_samples, new_log_priors, old_samples, log_old_weights)
+        w2 = abc2._calculate_log_weights(
+            new_samples, new_log_priors, old_samples, log_old_weights)
+        self.assertEqual(w1.shape, (5, ))
+        self.assertTrue(np.allclose(w1, w2))
+
+    def test_tell_returns_copy(self):
+        # Tests modifying the accepted points does not change the sampler
+        abc = pints.ABCSMC(self.log_prior)
+        abc.set_intermediate_size(10)
+        abc.set_threshold_schedule([6, 4])
+        xs = abc.ask(3)
+        accepted = abc.tell([1, 1, 1])
+        self.assertTrue(np.all(accepted == xs))
+        accepted[:] = -1
+        self.assertTrue(np.all(np.array(abc._samples[0]) == xs))
+
+    def test_logging(self):
+        # Tests the sampler is silent, and logs its threshold via controller
+        np.random.seed(1)
+        abc = pints.ABCSMC(self.log_prior)
+        abc.set_intermediate_size(2)
+        abc.set_threshold_schedule([6, 4])
+        with StreamCapture() as capture:
+            while abc._t == 0:
+                xs = abc.ask(2)
+                abc.tell([self.error_measure(x) for x in xs])
+        self.assertEqual(capture.text(), '')
+
+        abc = pints.ABCController(
+            self.error_measure, self.log_prior, method=pints.ABCSMC)
+        abc.set_max_iterations(3)
+        abc.set_log_to_screen(True)
+        with StreamCapture() as capture:
+            abc.run()
+        lines = capture.text().splitlines()
+        self.assertIn('t     Threshold', lines[2])
+
     def test_name(self):
         abc = pints.ABCSMC(self.log_prior)
         self.assertEqual(abc.name(), 'ABC-SMC')
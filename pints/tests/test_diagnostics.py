@@ -26,6 +26,15 @@ class TestDiagnostics(unittest.TestCase):
         for i in range(0, len(x)):
             self.assertAlmostEqual(y[i], y_true[i])
 
+        # Compare with direct (non-FFT) calculation on a longer series
+        np.random.seed(1)
+        x = np.cumsum(np.random.normal(size=501))
+        z = (x - np.mean(x)) / (np.std(x) * np.sqrt(len(x)))
+        y_true = np.correlate(z, z, mode='full')[len(x) - 1:]
+        y = pints._diagnostics.autocorrelation(x)
+        self.assertEqual(y.shape, y_true.shape)
+        self.assertTrue(np.allclose(y, y_true))
+
     def test_autocorrelation_negative(self):
         # Tests autocorrelation_negative yields the correct result
         # under both possibilities
@@ -38,6 +47,10 @@ class TestDiagnostics(unittest.TestCase):
         x = np.array([1, 2, 3, 4, 1, 1])
         self.assertEqual(pints._diagnostics._autocorrelate_negative(x), 6)
 
+        # Test for case where the first element is negative
+        x = np.array([-1, 2, 3])
+        self.assertEqual(pints._diagnostics._autocorrelate_negative(x), 0)
+
     def test_effective_sample_size_single_parameter(self):
         # Tests that ESS for a single parameter is correct
 
@@ -859,13 +859,17 @@ class TestPrior(unittest.TestCase):
         x = p.sample(n)
         self.assertEqual(x.shape, (n, d))
 
-        # Roughly check distribution (main checks are in numpy!)
+        # Roughly check distribution (main checks are in numpy!), allowing
+        # for 5 standard errors of the sample mean and variance
         np.random.seed(1)
         p = pints.MultivariateGaussianLogPrior(mean, covariance)
-        x = p.sample(10000)
-        self.assertTrue(np.all(np.abs(mean - x.mean(axis=0)) < 0.1))
+        n = 10000
+        x = p.sample(n)
+        var = np.diag(covariance)
+        self.assertTrue(np.all(
+            np.abs(mean - x.mean(axis=0)) < 5 * np.sqrt(var / n)))
         self.assertTrue(np.all(
-            np.abs(np.diag(covariance) - x.std(axis=0)**2) < 0.1))
+            np.abs(var - x.var(axis=0)) < 5 * var * np.sqrt(2 / (n - 1))))
 
     def test_student_t_prior(self):
         # Test two specific function values
@@ -49,6 +49,20 @@ class TestNonElementWiseIdentityTransformation(pints.IdentityTransformation):
         return False
 
 
+class ShiftedLogTransformation(pints.LogTransformation):
+    """
+    A testing subclass of a built-in transformation, that reimplements only
+    its public methods: ``p = exp(q) + 1``.
+    """
+    def to_model(self, q):
+        """ See :meth:`Transformation.to_model()`. """
+        return np.exp(pints.vector(q)) + 1
+
+    def to_search(self, p):
+        """ See :meth:`Transformation.to_search()`. """
+        return np.log(pints.vector(p) - 1)
+
+
 class TestAbstractClassTransformation(unittest.TestCase):
     # Test methods defined in the abstract class
 
@@ -78,6 +92,8 @@ class TestAbstractClassTransformation(unittest.TestCase):
     def test_jacobian(self):
         # Test Jacobian
         self.assertTrue(np.allclose(self.t.jacobian(self.x), self.j))
+        self.assertTrue(np.allclose(
+            self.t.jacobian_diag(self.x), np.diagonal(self.j)))
 
     def test_jacobian_S1(self):
         # Test Jacobian derivatives
@@ -89,6 +105,10 @@ class TestAbstractClassTransformation(unittest.TestCase):
         # Test log-Jacobian determinant
         self.assertAlmostEqual(self.t.log_jacobian_det(self.x), self.log_j_det)
 
+        # Test determinant that would overflow is handled
+        x = [200., 200., 200., 200.]
+        self.assertAlmostEqual(self.t.log_jacobian_det(x), 800.)
+
     def test_log_jacobian_det_S1(self):
         # Test log-Jacobian determinant derivatives
         calc_val, calc_deriv = self.t.log_jacobian_det_S1(self.x)
@@ -106,6 +126,45 @@ class TestAbstractClassTransformation(unittest.TestCase):
         self.assertTrue(
             np.allclose(self.t.convert_covariance_matrix(cov, self.x), tcov))
 
+        # Test full covariance matrix, and a non-element-wise transformation
+        cov = np.outer(sd, sd) * 0.5 + np.diag(sd ** 2) * 0.5
+        jac_inv = np.diag(1 / np.array(self.p))
+        tcov = np.matmul(np.matmul(jac_inv, cov), jac_inv.T)
+        self.assertTrue(
+            np.allclose(self.t.convert_covariance_matrix(cov, self.x), tcov))
+        t = TestNonElementWiseIdentityTransformation(4)
+        self.assertTrue(
+            np.allclose(t.convert_covariance_matrix(cov, self.x), cov))
+        self.assertTrue(
+            np.allclose(t.convert_standard_deviation(sd, self.x), sd))
+
+    def test_without_elementwise(self):
+        # Test a transformation that does not implement elementwise() falls
+        # back to the general, full-Jacobian methods
+        self.assertRaises(NotImplementedError, self.t.elementwise)
+        t = pints.LogTransformation(4)
+
+        sd = np.array([0.01, 0.1, 1., 99.9])
+        cov = np.outer(sd, sd) * 0.5 + np.diag(sd ** 2) * 0.5
+        self.assertTrue(np.allclose(
+            self.t.convert_standard_deviation(sd, self.x),
+            t.convert_standard_deviation(sd, self.x)))
+        self.assertTrue(np.allclose(
+            self.t.convert_covariance_matrix(cov, self.x),
+            t.convert_covariance_matrix(cov, self.x)))
+
+        log_pdf = pints.toy.GaussianLogPDF([1, 2, 3, 4], [1, 2, 3, 4])
+        fx, dfx = self.t.convert_log_pdf(log_pdf).evaluateS1(self.x)
+        gx, dgx = t.convert_log_pdf(log_pdf).evaluateS1(self.x)
+        self.assertAlmostEqual(fx, gx)
+        self.assertTrue(np.allclose(dfx, dgx))
+
+        error = pints.ProbabilityBasedError(log_pdf)
+        fx, dfx = self.t.convert_error_measure(error).evaluateS1(self.x)
+        gx, dgx = t.convert_error_measure(error).evaluateS1(self.x)
+        self.assertAlmostEqual(fx, gx)
+        self.assertTrue(np.allclose(dfx, dgx))
+
 
 class TestComposedTransformationElementWise(unittest.TestCase):
     # Test ComposedTransformation class for element-wise case
@@ -152,6 +211,8 @@ class TestComposedTransformationElementWise(unittest.TestCase):
     def test_jacobian(self):
         # Test Jacobian
         self.assertTrue(np.allclose(self.t.jacobian(self.x), self.j))
+        self.assertTrue(np.allclose(
+            self.t.jacobian_diag(self.x), np.diagonal(self.j)))
 
     def test_jacobian_S1(self):
         # Test Jacobian derivatives
@@ -176,6 +237,77 @@ class TestComposedTransformationElementWise(unittest.TestCase):
         self.assertTrue(
             np.allclose(self.x, self.t.to_search(self.t.to_model(self.x))))
 
+    def test_to_model_and_log_jacobian_det(self):
+        # Test combined method gives the same results as the separate ones
+        ts = [
+            self.t,
+            pints.ComposedTransformation(
+                pints.LogitTransformation(2), pints.LogTransformation(1),
+                pints.RectangularBoundariesTransformation([1, 2], [3, 4])),
+        ]
+        xs = [self.x, [-800., 0.5, 3., -40., 700.]]
+        for t, x in zip(ts, xs):
+            p, j = t._to_model_and_log_jacobian_det(x)
+            self.assertTrue(np.allclose(p, t.to_model(x)))
+            self.assertAlmostEqual(j, t.log_jacobian_det(x))
+
+            p, jac, j, j_s1 = t._to_model_and_log_jacobian_det_S1(x)
+            self.assertTrue(np.allclose(p, t.to_model(x)))
+            self.assertTrue(np.allclose(jac, t.jacobian_diag(x)))
+            self.assertAlmostEqual(j, t.log_jacobian_det(x))
+            self.assertTrue(np.allclose(j_s1, t.log_jacobian_det_S1(x)[1]))
+
+    def test_merged(self):
+        # Test neighbouring transformations of the same type are merged
+        ts = [
+            pints.LogTransformation(1),
+            pints.LogTransformation(2),
+            pints.RectangularBoundariesTransformation([1], [2]),
+            pints.RectangularBoundariesTransformation([3, 4], [5, 6]),
+            pints.ScalingTransformation([2]),
+            pints.ScalingTransformation([3, 4], [1, 2]),
+            pints.LogitTransformation(1),
+            pints.IdentityTransformation(1),
+            pints.IdentityTransformation(1),
+            pints.LogitTransformation(1),
+        ]
+        t = pints.ComposedTransformation(*ts)
+        self.assertEqual(len(t._transformations), 6)
+        self.assertEqual(t.n_parameters(), 13)
+
+        q = np.linspace(-3, 3, 13)
+        p = np.concatenate([
+            ti.to_model(qi) for ti, qi in zip(ts, np.split(
+                q, np.cumsum([ti.n_parameters() for ti in ts])[:-1]))])
+        self.assertTrue(np.allclose(t.to_model(q), p))
+        self.assertTrue(np.allclose(t.to_search(p), q))
+        j, dj = t.log_jacobian_det_S1(q)
+        self.assertAlmostEqual(j, sum(
+            ti.log_jacobian_det(qi) for ti, qi in zip(ts, np.split(
+                q, np.cumsum([ti.n_parameters() for ti in ts])[:-1]))))
+
+        # Subclasses are not merged
+        t = pints.ComposedTransformation(
+            pints.ScalingTransformation([2]),
+            pints.UnitCubeTransformation([1], [2]))
+        self.assertEqual(len(t._transformations), 2)
+
+    def test_nested(self):
+        # Test nested composed transformations give the same results
+        t1 = pints.IdentityTransformation(1)
+        t2 = pints.RectangularBoundariesTransformation([1, 2], [10, 20])
+        t3 = pints.LogTransformation(1)
+        t = pints.ComposedTransformation(
+            t1, pints.ComposedTransformation(t2, t3))
+        self.assertEqual(len(t._transformations), 3)
+        self.assertEqual(t.n_parameters(), 4)
+        self.assertTrue(t.elementwise())
+        self.assertTrue(np.allclose(t.to_search(self.p), self.x))
+        self.assertTrue(np.allclose(t.to_model(self.x), self.p))
+        calc_val, calc_deriv = t.log_jacobian_det_S1(self.x)
+        self.assertAlmostEqual(calc_val, self.log_j_det)
+        self.assertTrue(np.allclose(calc_deriv, self.log_j_det_s1))
+
     def test_elementwise(self):
         # Test is elementwise
         self.assertTrue(self.t.elementwise())
@@ -226,6 +358,8 @@ class TestComposedTransformation(unittest.TestCase):
     def test_jacobian(self):
         # Test Jacobian
         self.assertTrue(np.allclose(self.t.jacobian(self.x), self.j))
+        self.assertTrue(np.allclose(
+            self.t.jacobian_diag(self.x), np.diagonal(self.j)))
 
     def test_jacobian_S1(self):
         # Test Jacobian derivatives
@@ -235,7 +369,7 @@ class TestComposedTransformation(unittest.TestCase):
 
     def test_log_jacobian_det(self):
         # Test log-Jacobian determinant
-        self.assertEqual(self.t.log_jacobian_det(self.x), self.log_j_det)
+        self.assertAlmostEqual(self.t.log_jacobian_det(self.x), self.log_j_det)
 
     def test_log_jacobian_det_S1(self):
         # Test log-Jacobian determinant derivatives
@@ -243,6 +377,18 @@ class TestComposedTransformation(unittest.TestCase):
         self.assertAlmostEqual(calc_val, self.log_j_det)
         self.assertTrue(np.allclose(calc_deriv, self.log_j_det_s1))
 
+    def test_to_model_and_log_jacobian_det(self):
+        # Test combined method gives same results as separate methods
+        p, j = self.t._to_model_and_log_jacobian_det(self.x)
+        self.assertTrue(np.allclose(p, self.p))
+        self.assertAlmostEqual(j, self.log_j_det)
+
+        p, jac, j, j_s1 = self.t._to_model_and_log_jacobian_det_S1(self.x)
+        self.assertTrue(np.allclose(p, self.p))
+        self.assertTrue(np.allclose(jac, self.j))
+        self.assertAlmostEqual(j, self.log_j_det)
+        self.assertTrue(np.allclose(j_s1, self.log_j_det_s1))
+
     def test_against_elementwise_transformation(self):
         # Test general case gives the same result as the elementwise case
         t1 = pints.IdentityTransformation(1)  # This is element-wise
@@ -258,6 +404,25 @@ class TestComposedTransformation(unittest.TestCase):
         _, t_elem_deriv = t_elem.log_jacobian_det_S1(self.x)
         self.assertTrue(np.allclose(t_deriv, t_elem_deriv))
 
+    def test_jacobian_inverse(self):
+        # Test block-wise inverse matches the full pseudo-inverse
+        self.assertTrue(np.allclose(
+            self.t._jacobian_inverse(self.x), np.linalg.pinv(self.j)))
+
+        # Test conversions are unchanged
+        C = np.array([[1., 0.1, 0., 0.2],
+                      [0.1, 2., 0.3, 0.],
+                      [0., 0.3, 3., 0.1],
+                      [0.2, 0., 0.1, 4.]])
+        j_inv = np.linalg.pinv(self.j)
+        self.assertTrue(np.allclose(
+            self.t.convert_covariance_matrix(C, self.x),
+            j_inv @ C @ j_inv.T))
+        s = np.sqrt(np.diagonal(C))
+        self.assertTrue(np.allclose(
+            self.t.convert_standard_deviation(s, self.x),
+            s / np.diagonal(self.j)))
+
     def test_retransform(self):
         # Test forward transform the inverse transform
         self.assertTrue(
@@ -308,6 +473,8 @@ class TestIdentityTransformation(unittest.TestCase):
     def test_jacobian(self):
         # Test Jacobian
         self.assertTrue(np.allclose(self.t4.jacobian(self.x), self.j))
+        self.assertTrue(np.allclose(
+            self.t4.jacobian_diag(self.x), np.diagonal(self.j)))
 
     def test_jacobian_S1(self):
         # Test Jacobian derivatives
@@ -315,6 +482,13 @@ class TestIdentityTransformation(unittest.TestCase):
         self.assertTrue(np.allclose(calc_mat, self.j))
         self.assertTrue(np.allclose(calc_deriv, self.j_s1))
 
+        # Test constant results are reused, and cannot be modified
+        calc_mat2, calc_deriv2 = self.t4.jacobian_S1(self.x)
+        self.assertIs(calc_mat2, calc_mat)
+        self.assertIs(calc_deriv2, calc_deriv)
+        self.assertFalse(calc_mat.flags.writeable)
+        self.assertFalse(calc_deriv.flags.writeable)
+
     def test_log_jacobian_det(self):
         # Test log-Jacobian determinant
         self.assertEqual(self.t4.log_jacobian_det(self.x), self.log_j_det)
@@ -380,6 +554,8 @@ class TestLogitTransformation(unittest.TestCase):
     def test_jacobian(self):
         # Test Jacobian
         self.assertTrue(np.allclose(self.t4.jacobian(self.x), self.j))
+        self.assertTrue(np.allclose(
+            self.t4.jacobian_diag(self.x), np.diagonal(self.j)))
 
     def test_jacobian_S1(self):
         # Test Jacobian derivatives
@@ -387,11 +563,24 @@ class TestLogitTransformation(unittest.TestCase):
         self.assertTrue(np.allclose(calc_mat, self.j))
         self.assertTrue(np.allclose(calc_deriv, self.j_s1))
 
+        # Test relative accuracy near zero: d/dq J = -q / 8 + O(q^3)
+        _, calc_deriv = self.t1.jacobian_S1([1e-12])
+        self.assertAlmostEqual(calc_deriv[0, 0, 0] / -1.25e-13, 1.)
+
     def test_log_jacobian_det(self):
         # Test log-Jacobian determinant
         self.assertAlmostEqual(self.t4.log_jacobian_det(self.x),
                                self.log_j_det)
 
+        # Test no underflow to -inf for large |q|, where the derivative of
+        # the logit saturates: log|J| = -|q| - 2 * log(1 + exp(-|q|))
+        t2 = pints.LogitTransformation(2)
+        x = [-50., 50.]
+        self.assertAlmostEqual(t2.log_jacobian_det(x), -100.)
+        calc_val, calc_deriv = t2.log_jacobian_det_S1(x)
+        self.assertAlmostEqual(calc_val, -100.)
+        self.assertTrue(np.allclose(calc_deriv, [1., -1.]))
+
     def test_log_jacobian_det_S1(self):
         # Test log-Jacobian determinant derivatives
         calc_val, calc_deriv = self.t4.log_jacobian_det_S1(self.x)
@@ -416,6 +605,33 @@ class TestLogitTransformation(unittest.TestCase):
         self.assertTrue(self.t1.elementwise())
         self.assertTrue(self.t4.elementwise())
 
+    def test_convert_saturated(self):
+        # Test conversion where the Jacobian has a zero on its diagonal, which
+        # is pseudo-inverted to zero
+        t = pints.LogitTransformation(2)
+        q = [0.5, 800]
+        d = t.jacobian_diag(q)
+        self.assertEqual(d[1], 0)
+        cov = np.array([[1, 0.5], [0.5, 2]])
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            c = t.convert_covariance_matrix(cov, q)
+        self.assertTrue(np.allclose(
+            c, [[1 / d[0] ** 2, 0], [0, 0]], atol=0, rtol=1e-14))
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            s = t.convert_standard_deviation([1, 2], q)
+        self.assertTrue(np.allclose(s, [1 / d[0], 0], atol=0, rtol=1e-14))
+
+        # Test the same in a non-element-wise composed transformation
+        t = pints.ComposedTransformation(
+            t, TestNonElementWiseIdentityTransformation(1))
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            c = t.convert_covariance_matrix(np.eye(3), q + [1])
+        self.assertTrue(np.allclose(
+            c, np.diag([1 / d[0] ** 2, 0, 1]), atol=0, rtol=1e-14))
+
 
 class TestLogTransformation(unittest.TestCase):
     # Test LogTransformation class
@@ -458,6 +674,8 @@ class TestLogTransformation(unittest.TestCase):
     def test_jacobian(self):
         # Test Jacobian
         self.assertTrue(np.allclose(self.t4.jacobian(self.x), self.j))
+        self.assertTrue(np.allclose(
+            self.t4.jacobian_diag(self.x), np.diagonal(self.j)))
 
     def test_jacobian_S1(self):
         # Test Jacobian derivatives
@@ -482,6 +700,13 @@ class TestLogTransformation(unittest.TestCase):
             self.assertTrue(np.isnan(self.t1.to_search(-1.)))
             self.assertTrue(np.isinf(self.t1.to_search(0)))
 
+        # Test column and row vectors are accepted, but not matrices
+        x = np.array(self.x)
+        self.assertTrue(np.allclose(self.t4.to_model(x.reshape(4, 1)), self.p))
+        self.assertTrue(np.allclose(self.t4.to_model(x.reshape(1, 4)), self.p))
+        self.assertRaises(ValueError, self.t4.to_model, x.reshape(2, 2))
+        self.assertRaises(ValueError, self.t4.to_search, np.ones((2, 2)))
+
     def test_retransform(self):
         # Test forward transform the inverse transform
         self.assertTrue(
@@ -494,6 +719,19 @@ class TestLogTransformation(unittest.TestCase):
         self.assertTrue(self.t1.elementwise())
         self.assertTrue(self.t4.elementwise())
 
+    def test_subclass_jacobian(self):
+        # Test jacobian_diag() uses a jacobian() reimplemented by a subclass
+        class DoubledJacobian(pints.LogTransformation):
+            def jacobian(self, q):
+                return 2 * super().jacobian(q)
+
+        t = DoubledJacobian(4)
+        self.assertTrue(
+            np.allclose(t.jacobian_diag(self.x), 2 * np.diagonal(self.j)))
+        self.assertTrue(np.allclose(
+            t.convert_standard_deviation(np.ones(4), self.x),
+            0.5 / np.array(self.p)))
+
 
 class TestRectangularBoundariesTransformation(unittest.TestCase):
     # Test RectangularBoundariesTransformation class
@@ -556,6 +794,21 @@ class TestRectangularBoundariesTransformation(unittest.TestCase):
         # Test Jacobian
         self.assertTrue(np.allclose(self.t2.jacobian(self.x), self.j))
         self.assertTrue(np.allclose(self.t2b.jacobian(self.x), self.j))
+        self.assertTrue(np.allclose(
+            self.t2.jacobian_diag(self.x), np.diagonal(self.j)))
+        self.assertTrue(np.allclose(
+            self.t2b.jacobian_diag(self.x), np.diagonal(self.j)))
+
+        # Test no overflow for large |q|
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            d = self.t2.jacobian_diag([-800., 800.])
+            _, d_s1 = self.t2.jacobian_S1([-800., 800.])
+        self.assertTrue(np.all(np.isfinite(d)))
+        self.assertTrue(np.all(np.isfinite(d_s1)))
+        d = self.t2.jacobian_diag([-30., 30.])
+        self.assertAlmostEqual(d[0] / np.exp(-30.), 9.)
+        self.assertAlmostEqual(d[1] / np.exp(-30.), 18.)
 
     def test_jacobian_S1(self):
         # Test Jacobian derivatives
@@ -573,6 +826,14 @@ class TestRectangularBoundariesTransformation(unittest.TestCase):
         self.assertAlmostEqual(self.t2b.log_jacobian_det(self.x),
                                self.log_j_det)
 
+        # Test no underflow to -inf for large |q|
+        x = [-50., 50.]
+        log_j_det = np.log(9.) + np.log(18.) - 100.
+        self.assertAlmostEqual(self.t2.log_jacobian_det(x), log_j_det)
+        calc_val, calc_deriv = self.t2.log_jacobian_det_S1(x)
+        self.assertAlmostEqual(calc_val, log_j_det)
+        self.assertTrue(np.allclose(calc_deriv, [1., -1.]))
+
     def test_log_jacobian_det_S1(self):
         # Test log-Jacobian determinant derivatives
         calc_val, calc_deriv = self.t2.log_jacobian_det_S1(self.x)
@@ -630,6 +891,8 @@ class TestScalingTransformation(unittest.TestCase):
     def test_jacobian(self):
         # Test Jacobian
         self.assertTrue(np.allclose(self.t.jacobian(self.x), self.j))
+        self.assertTrue(np.allclose(
+            self.t.jacobian_diag(self.x), np.diagonal(self.j)))
 
     def test_jacobian_S1(self):
         # Test Jacobian derivatives
@@ -701,6 +964,8 @@ class TestScalingTransformationWithTranslation(unittest.TestCase):
     def test_jacobian(self):
         # Test Jacobian
         self.assertTrue(np.allclose(self.t.jacobian(self.x), self.j))
+        self.assertTrue(np.allclose(
+            self.t.jacobian_diag(self.x), np.diagonal(self.j)))
 
     def test_jacobian_S1(self):
         # Test Jacobian derivatives
@@ -917,6 +1182,13 @@ class TestTransformedWrappers(unittest.TestCase):
         self.assertTrue(np.allclose(trtx, rx))
         self.assertTrue(np.allclose(trts1, ts1))
 
+        # Test evaluateS1() with a non-element-wise transformation
+        tr = pints.TransformedErrorMeasure(
+            r, TestNonElementWiseIdentityTransformation(2))
+        trx, trs1 = tr.evaluateS1(x)
+        self.assertTrue(np.allclose(trx, rx))
+        self.assertTrue(np.allclose(trs1, s1))
+
         # Test invalid transform
         self.assertRaises(ValueError, pints.TransformedErrorMeasure, r,
                           pints.LogTransformation(3))
@@ -944,6 +1216,78 @@ class TestTransformedWrappers(unittest.TestCase):
         self.assertTrue(np.allclose(trtx, trx))
         self.assertTrue(np.allclose(trts1, ts1))
 
+        # Test evaluateS1() with a non-element-wise transformation
+        tr = pints.TransformedLogPDF(
+            r, TestNonElementWiseIdentityTransformation(2))
+        trx, trs1 = tr.evaluateS1(x)
+        self.assertTrue(np.allclose(trx, rx))
+        self.assertTrue(np.allclose(trs1, s1))
+
+        # Test repeated calls at the same point reuse the transformed point
+        class CountingLogTransformation(pints.LogTransformation):
+            n_calls = 0
+
+            def _to_model_and_log_jacobian_det(self, q):
+                self.n_calls += 1
+                return super(CountingLogTransformation,
+                             self)._to_model_and_log_jacobian_det(q)
+
+        t = CountingLogTransformation(2)
+        tr = t.convert_log_pdf(r)
+        self.assertAlmostEqual(tr(tx), r(x) + log_j_det)
+        self.assertEqual(t.n_calls, 1)
+        trtx, trts1 = tr.evaluateS1(tx)
+        self.assertTrue(np.allclose(trtx, r(x) + log_j_det))
+        self.assertTrue(np.allclose(trts1, ts1))
+        self.assertAlmostEqual(tr(tx), r(x) + log_j_det)
+        self.assertEqual(t.n_calls, 1)
+        self.assertAlmostEqual(tr(x), r(np.exp(x)) + np.sum(x))
+        self.assertEqual(t.n_calls, 2)
+
+        # Test a subclass reimplementing only public methods is used
+        t = ShiftedLogTransformation(2)
+        tr = t.convert_log_pdf(r)
+        self.assertAlmostEqual(tr(tx), r(np.array(x) + 1) + log_j_det)
+        rx, s1 = r.evaluateS1(np.array(x) + 1)
+        trtx, trts1 = tr.evaluateS1(tx)
+        self.assertAlmostEqual(trtx, rx + log_j_det)
+        self.assertTrue(np.allclose(trts1, np.matmul(s1, j) + np.ones(2)))
+
+        # Test a subclass reimplementing the Jacobian is used for gradients
+        class DoubledJacobian(pints.LogTransformation):
+            def jacobian(self, q):
+                return 2 * super().jacobian(q)
+
+            def log_jacobian_det_S1(self, q):
+                return self.log_jacobian_det(q), np.zeros(2)
+
+        tr = DoubledJacobian(2).convert_log_pdf(r)
+        rx, s1 = r.evaluateS1(x)
+        trtx, trts1 = tr.evaluateS1(tx)
+        self.assertTrue(np.allclose(trts1, 2 * np.matmul(s1, j)))
+
+        # Test caching does not make arrays owned by the transformation
+        # read-only
+        class StoringLogTransformation(pints.LogTransformation):
+            def _to_model_and_log_jacobian_det(self, q):
+                r = super(StoringLogTransformation,
+                          self)._to_model_and_log_jacobian_det(q)
+                self.p = r[0]
+                return r
+
+            def _to_model_and_log_jacobian_det_S1(self, q):
+                r = super(StoringLogTransformation,
+                          self)._to_model_and_log_jacobian_det_S1(q)
+                self.p = r[0]
+                return r
+
+        t = StoringLogTransformation(2)
+        tr = t.convert_log_pdf(r)
+        tr(tx)
+        self.assertTrue(t.p.flags.writeable)
+        tr.evaluateS1(x)
+        self.assertTrue(t.p.flags.writeable)
+
         # Test invalid transform
         self.assertRaises(ValueError, pints.TransformedLogPDF, r,
                           pints.LogTransformation(3))
@@ -966,6 +1310,42 @@ class TestTransformedWrappers(unittest.TestCase):
         self.assertEqual(x.shape, (n, d))
         self.assertTrue(np.all(x < 0.))
 
+        # Test samples are transformed row by row
+        r = pints.UniformLogPrior([0.1, 0.1, 1, 0.1], [0.9, 0.9, 2, 0.9])
+        ts = [
+            pints.ComposedTransformation(
+                pints.LogitTransformation(1),
+                pints.IdentityTransformation(1),
+                pints.RectangularBoundariesTransformation([1], [2]),
+                pints.ScalingTransformation([2], [1])),
+            SwappingTransformation(4),
+        ]
+        for t in ts:
+            tr = t.convert_log_prior(r)
+            np.random.seed(1)
+            x = tr.sample(10)
+            np.random.seed(1)
+            y = np.array([t.to_search(p) for p in r.sample(10)])
+            self.assertEqual(x.shape, (10, 4))
+            self.assertTrue(np.allclose(x, y))
+
+            # And back to the model space
+            p = t._to_model_batch(x)
+            self.assertEqual(p.shape, (10, 4))
+            self.assertTrue(np.allclose(p, [t.to_model(q) for q in x]))
+
+        # Test a subclass reimplementing to_search() is used for sampling
+        t = ShiftedLogTransformation(2)
+        r = pints.UniformLogPrior([1.1, 1.1], [2, 2])
+        tr = t.convert_log_prior(r)
+        np.random.seed(1)
+        x = tr.sample(10)
+        np.random.seed(1)
+        self.assertTrue(np.allclose(x, np.log(r.sample(10) - 1)))
+
+        # And a subclass reimplementing to_model() is used to transform back
+        self.assertTrue(np.allclose(t._to_model_batch(x), np.exp(x) + 1))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -45,16 +45,37 @@ class NealsFunnelLogPDF(ToyLogPDF):
         self._s1 = 9.0
         self._s1_inv = 1.0 / self._s1
         self._m1 = 0
+        self._log_2pi = np.log(2 * np.pi)
 
     def __call__(self, x):
+        return self._evaluate(x)[0]
+
+    def _evaluate(self, x):
+        """
+        Returns the log-pdf at ``x``, along with ``nu``, the remaining
+        parameters ``x_temp``, and ``exp(-nu)``, for reuse in
+        :meth:`evaluateS1()`.
+        """
         if len(x) != self._n_parameters:
             raise ValueError(
                 'Length of x must be equal number of parameters')
+        x = np.asarray(x, dtype=float)
         nu = x[-1]
         x_temp = x[:-1]
-        x_log_pdf = [scipy.stats.norm.logpdf(y, 0, np.exp(nu / 2))
-                     for y in x_temp]
-        return np.sum(x_log_pdf) + scipy.stats.norm.logpdf(nu, 0, 3)
+        cons = np.exp(-nu)
+
+        # Each x_i ~ N(0, exp(nu / 2)), with log-pdf
+        #   -0.5 * log(2 pi) - nu / 2 - 0.5 * x_i^2 * exp(-nu)
+        # so that the sum over all x_i only needs a single dot product
+        x_log_pdf = (
+            -0.5 * cons * np.dot(x_temp, x_temp)
+            - 0.5 * (self._n_parameters - 1) * (self._log_2pi + nu))
+
+        # And nu ~ N(0, 3)
+        nu_log_pdf = -0.5 * (self._log_2pi + nu**2 * self._s1_inv) \
+            - 0.5 * np.log(self._s1)
+
+        return x_log_pdf + nu_log_pdf, nu, x_temp, cons
 
     def distance(self, samples):
         """ See :meth:`pints.toy.ToyLogPDF.distance()`. """
@@ -62,16 +83,10 @@ class NealsFunnelLogPDF(ToyLogPDF):
 
     def evaluateS1(self, x):
         """ See :meth:`LogPDF.evaluateS1()`. """
-        L = self.__call__(x)
-
-        nu = x[-1]
-        x_temp = x[:-1]
-        cons = np.exp(-nu)
-        dnu_first = [0.5 * (cons * var**2 - 1) for var in x_temp]
-        dnu = np.sum(dnu_first) - nu / 9.0
-        dL = [-var * cons for var in x_temp]
-        dL.append(dnu)
-        dL = np.array(dL)
+        L, nu, x_temp, cons = self._evaluate(x)
+        dL = np.empty(self._n_parameters)
+        dL[:-1] = -x_temp * cons
+        dL[-1] = np.sum(0.5 * (cons * x_temp**2 - 1)) - nu / 9.0
         return L, dL
 
     def kl_divergence(self, samples):
@@ -117,13 +132,12 @@ class NealsFunnelLogPDF(ToyLogPDF):
     def sample(self, n_samples):
         """ See :meth:`pints.toy.ToyLogPDF.sample()`. """
         n = self._n_parameters
-        samples = np.zeros((n_samples, n))
-        for i in range(n_samples):
-            nu = np.random.normal(0, 3, 1)[0]
-            sd = np.exp(nu / 2)
-            x = np.random.normal(0, sd, n - 1)
-            samples[i, 0:(n - 1)] = x
-            samples[i, n - 1] = nu
+        samples = np.empty((n_samples, n))
+        nu = np.random.normal(0, 3, n_samples)
+        sd = np.exp(nu / 2)
+        samples[:, 0:(n - 1)] = \
+            np.random.normal(0, 1, (n_samples, n - 1)) * sd[:, np.newaxis]
+        samples[:, n - 1] = nu
         return samples
 
     def suggested_bounds(self):
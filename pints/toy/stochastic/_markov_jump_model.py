@@ -5,8 +5,9 @@
 # released under the BSD 3-clause license. See accompanying LICENSE.md for
 # copyright notice and full license details.
 #
+import math
+
 import numpy as np
-import scipy.interpolate
 
 import pints
 
@@ -23,24 +24,25 @@ class MarkovJumpModel(pints.ForwardModel, ToyModel):
 
     Simulations are performed using Gillespie's algorithm [1]_, [2]_:
 
-    1. Sample values :math:`r_0`, :math:`r_1`, from a uniform distribution
+    1. Sample values :math:`r_1`, :math:`r_2`, from a uniform distribution
 
     .. math::
-        r_0, r_1 \sim U(0,1)
+        r_1, r_2 \sim U(0,1)
 
     2. Calculate the time :math:`\tau` until the next single reaction as
 
     .. math::
-        \tau = \frac{-\ln(r)}{a_0}
+        \tau = \frac{-\ln(r_1)}{a_0}
 
     where :math:`a_0` is the sum of the propensities at the current time.
 
-    3. Decide which reaction, i, takes place using :math:`r_1 * a_0` and
-    iterating through propensities. Since :math:`r_1` is a a value between 0
-    and 1 and :math`a_0` is the sum of all propensities, we can find :math:`k`
-    for which :math:`s_k / a_0 <= r_2 < s_(k+1) / a_0` where :math:`s_j` is the
-    sum of the first :math:`j` propensities at time :math:`t`. We then choose
-    :math:`i` as the reaction corresponding to propensity k.
+    3. Decide which reaction, i, takes place using :math:`r_2 * a_0` and a
+    binary search through the cumulative propensities. Since :math:`r_2` is a
+    value between 0 and 1 and :math:`a_0` is the sum of all propensities, we
+    can find :math:`k` for which :math:`s_k / a_0 <= r_2 < s_(k+1) / a_0`
+    where :math:`s_j` is the sum of the first :math:`j` propensities at time
+    :math:`t`. We then choose :math:`i` as the reaction corresponding to
+    propensity k.
 
     4. Update the state :math:`x` at time :math:`t + \tau` as:
 
@@ -78,7 +80,7 @@ class MarkovJumpModel(pints.ForwardModel, ToyModel):
     def __init__(self, x0, V, propensities):
         super(MarkovJumpModel, self).__init__()
         self._x0 = np.asarray(x0)
-        self._V = V
+        self._V = np.array(V)
         self._propensities = propensities
         if any(self._x0 < 0):
             raise ValueError('Initial molecule count cannot be negative.')
@@ -95,36 +97,50 @@ class MarkovJumpModel(pints.ForwardModel, ToyModel):
                 + ' parameter(s).')
 
         # Setting the current propensities and summing them up
-        current_propensities = self._propensities(self._x0, rates)
-        prop_sum = np.sum(current_propensities)
+        cumulative_propensities = np.cumsum(
+            self._propensities(self._x0, rates))
+        prop_sum = cumulative_propensities[-1]
 
         # Initial time and count
         t = 0
         x = np.array(self._x0)
 
+        # Preallocate buffers for the times and mol counts, which are doubled
+        # in size whenever they are full
+        n = 1
+        time = np.empty(256)
+        mol_count = np.empty((256, ) + x.shape, dtype=x.dtype)
+        time[0] = t
+        mol_count[0] = x
+
         # Run Gillespie SSA, calculating time until next reaction, deciding
         # which reaction, and applying it
-        mol_count = [np.array(x)]
-        time = [t]
         while prop_sum > 0 and t <= max_time:
-            r_1, r_2 = np.random.uniform(0, 1), np.random.uniform(0, 1)
-            t += -np.log(r_1) / prop_sum
-            s = 0
-            r = 0
-            while s <= r_2 * prop_sum:
-                s += current_propensities[r]
-                r += 1
-            x += self._V[r - 1]
+            # Draw both random numbers with a single call
+            r_1, r_2 = np.random.random(2)
+            # Use math.log, which is much faster than np.log for scalars, but
+            # raises an error instead of returning -inf for r_1 = 0
+            t += -math.log(r_1) / prop_sum if r_1 > 0 else np.inf
+            # Find the first reaction whose cumulative propensity exceeds
+            # r_2 * prop_sum, using a binary search
+            r = np.searchsorted(
+                cumulative_propensities, r_2 * prop_sum, side='right')
+            x += self._V[r]
 
             # Calculate new current propensities
-            current_propensities = self._propensities(x, rates)
-            prop_sum = np.sum(current_propensities)
+            cumulative_propensities = np.cumsum(self._propensities(x, rates))
+            prop_sum = cumulative_propensities[-1]
 
             # Store new values
-            time.append(t)
-            mol_count.append(np.copy(x))
+            if n == len(time):
+                time = np.concatenate((time, np.empty(n)))
+                mol_count = np.concatenate(
+                    (mol_count, np.empty_like(mol_count)))
+            time[n] = t
+            mol_count[n] = x
+            n += 1
 
-        return np.array(time), np.array(mol_count)
+        return time[:n], mol_count[:n]
 
     def interpolate_mol_counts(self, time, mol_count, output_times):
         """
@@ -142,25 +158,13 @@ class MarkovJumpModel(pints.ForwardModel, ToyModel):
         if not np.all(output_times[1:] >= output_times[:-1]):
             raise ValueError('The output_times must be non-decreasing.')
 
-        # Interpolate as step function, decreasing mol_count by 1 at each
-        # reaction time point.
-        if len(time) == 1:
-            # Need at least 2 values to interpolate
-            return np.ones(len(output_times)) * mol_count[0]
-        else:
-            # Note: Can't use fill_value='extrapolate' here as:
-            #  1. This require scipy >= 0.17
-            #  2. There seems to be a bug in some scipy versions
-            interp_func = scipy.interpolate.interp1d(
-                time, mol_count, kind='previous', axis=0, fill_value=np.nan,
-                bounds_error=False)
-            values = interp_func(output_times)
-
-        # At any point past the final time, repeat the last value
-        values[output_times >= time[-1]] = mol_count[-1]
-        values[output_times < time[0]] = mol_count[0]
-
-        return values
+        # Interpolate as step function, taking the mol_count of the last
+        # reaction at or before each output time. Past the final time this
+        # repeats the last value, and before the first time the first value
+        # is used.
+        i = np.searchsorted(time, output_times, side='right') - 1
+        i[i < 0] = 0
+        return np.asarray(mol_count, dtype=float)[i]
 
     def simulate(self, parameters, times):
         """ See :meth:`pints.ForwardModel.simulate()`. """
@@ -169,7 +173,7 @@ class MarkovJumpModel(pints.ForwardModel, ToyModel):
             raise ValueError('Negative times are not allowed.')
 
         # Run Gillespie algorithm
-        time, mol_count = self.simulate_raw(parameters, max(times))
+        time, mol_count = self.simulate_raw(parameters, np.max(times))
 
         # Interpolate and return
         return self.interpolate_mol_counts(time, mol_count, times)